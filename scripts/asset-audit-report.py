@@ -22,6 +22,7 @@ Version: 1.0
 Requirements:
     - Python 3.8+
     - requests library
+    - orjson library (optional, faster JSON parsing and --json output)
     - GLPI REST API access (read-only sufficient)
 
 Usage:
@@ -35,14 +36,30 @@ Exit codes:
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import pickle
+import re
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import requests
+from string import Template
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from collections import defaultdict
+from itertools import chain
+
+try:
+    import orjson  # Optional: much faster JSON decoding/encoding
+except ImportError:
+    orjson = None
+
+# GLPI payloads can be several MB per endpoint; prefer orjson to parse them
+json_loads = orjson.loads if orjson is not None else json.loads
 
 # ============================================================================
 # CONFIGURATION
@@ -62,22 +79,46 @@ LOG_FILE = f"asset-audit-{datetime.now().strftime('%Y-%m-%d')}.log"
 
 # Report thresholds
 WARRANTY_WARNING_DAYS = 90
+WARRANTY_URGENT_DAYS = 30  # Expiring rows under this are flagged red
+
+# GLPI warranty dates are YYYY-MM-DD (optionally followed by a time)
+ISO_DATE_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})')
 LICENSE_UTILIZATION_WARN = 90  # Warn if >90% licenses used
 
+# Concurrency (one worker per inventory endpoint, pool sized with headroom)
+FETCH_WORKERS = 6
+HTTP_POOL_SIZE = 16
+HTTP_RETRIES = 3
+
+# Pagination (FETCH_WORKERS * PAGE_WORKERS stays within HTTP_POOL_SIZE)
+PAGE_SIZE = 200
+PAGE_WORKERS = 2
+
+# Report output buffer (64 KiB)
+REPORT_WRITE_BUFFER = 1 << 16
+
+# Response cache (parsed JSON reused when GLPI answers 304 Not Modified)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "asset-audit"
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
+def setup_logging(verbose: bool = False):
+    """Attach file and console handlers (deferred so --help creates no log file)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.FileHandler(LOG_FILE),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    if verbose:
+        logger.setLevel(logging.DEBUG)
+
 # ============================================================================
 # GLPI API CLIENT
 # ============================================================================
@@ -85,12 +126,33 @@ logger = logging.getLogger(__name__)
 class GLPIClient:
     """GLPI REST API client with session management"""
     
-    def __init__(self, base_url: str, username: str, password: str):
+    def __init__(self, base_url: str, username: str, password: str,
+                 cache_dir: Optional[Path] = None):
+        # Imported here so --help and argument errors skip loading requests/TLS
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         self.base_url = base_url.rstrip('/')
         self.username = username
         self.password = password
         self.session_token = None
         self.session = requests.Session()
+        self.cache_dir = cache_dir
+        
+        # Size the connection pool so concurrent fetches reuse keep-alive sockets,
+        # and retry transient gateway errors instead of failing the audit
+        retry = Retry(total=HTTP_RETRIES, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                              max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Ask GLPI for compressed JSON; requests decodes it transparently
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
+        })
         
     def init_session(self) -> bool:
         """Initialize GLPI API session"""
@@ -107,6 +169,12 @@ class GLPIClient:
             if response.status_code == 200:
                 data = response.json()
                 self.session_token = data.get('session_token')
+                # Every later call reuses these headers on the keep-alive session
+                self.session.headers.update({
+                    'Session-Token': self.session_token,
+                    'Content-Type': 'application/json',
+                    'Connection': 'keep-alive'
+                })
                 logger.info("✓ GLPI session initialized successfully")
                 return True
             else:
@@ -117,23 +185,20 @@ class GLPIClient:
             logger.error(f"Failed to connect to GLPI: {e}")
             return False
     
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
-        """Make GET request to GLPI API"""
+    def _request(self, endpoint: str, params: Optional[Dict] = None,
+                 headers: Optional[Dict] = None):
+        """Issue a GET and return the response for 200/206/304, else None"""
         if not self.session_token:
             logger.error("No active session - call init_session() first")
             return None
         
         try:
             url = f"{self.base_url}/{endpoint}"
-            headers = {
-                'Session-Token': self.session_token,
-                'Content-Type': 'application/json'
-            }
-            
-            response = self.session.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params, headers=headers)
             
-            if response.status_code == 200:
-                return response.json()
+            # GLPI answers 206 Partial Content when a range is a subset
+            if response.status_code in (200, 206, 304):
+                return response
             else:
                 logger.warning(f"GET {endpoint} returned {response.status_code}")
                 return None
@@ -142,14 +207,127 @@ class GLPIClient:
             logger.error(f"API request failed: {e}")
             return None
     
+    def _cache_path(self, endpoint: str, params: Optional[Dict]) -> Path:
+        """Cache file stem for an endpoint + params as seen by this user"""
+        query = json.dumps(params or {}, sort_keys=True)
+        key = f"{self.username}@{self.base_url}/{endpoint}?{query}"
+        return self.cache_dir / hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    def _fetch(self, endpoint: str, params: Optional[Dict] = None) -> Tuple[Any, str]:
+        """GET and parse an endpoint, returning (data, Content-Range header)
+        
+        With a cache directory configured, the stored ETag/Last-Modified is
+        sent as a conditional request and a 304 reuses the pickled result.
+        """
+        if self.cache_dir is None:
+            response = self._request(endpoint, params)
+            if response is None:
+                return None, ''
+            return json_loads(response.content), response.headers.get('Content-Range', '')
+        
+        stem = self._cache_path(endpoint, params)
+        meta_file = stem.with_suffix('.meta')
+        data_file = stem.with_suffix('.pkl')
+        
+        meta = {}
+        if meta_file.exists() and data_file.exists():
+            try:
+                meta = json.loads(meta_file.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                meta = {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        
+        response = self._request(endpoint, params, headers=headers or None)
+        if response is None:
+            return None, ''
+        
+        if response.status_code == 304:
+            try:
+                with data_file.open('rb') as f:
+                    logger.debug(f"GET {endpoint} not modified - using cached copy")
+                    return pickle.load(f), meta.get('content_range', '')
+            except (OSError, pickle.UnpicklingError, EOFError):
+                # Cache vanished underneath us - refetch unconditionally
+                response = self._request(endpoint, params)
+                if response is None:
+                    return None, ''
+        
+        data = json_loads(response.content)
+        content_range = response.headers.get('Content-Range', '')
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        
+        if etag or last_modified:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # Write-then-rename so concurrent readers never see a partial file
+                tmp_file = data_file.with_suffix(f'.tmp{os.getpid()}')
+                with tmp_file.open('wb') as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, data_file)
+                meta_file.write_text(json.dumps({
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'content_range': content_range
+                }), encoding='utf-8')
+            except OSError as e:
+                logger.debug(f"Could not cache {endpoint}: {e}")
+        
+        return data, content_range
+    
+    def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """Make GET request to GLPI API"""
+        return self._fetch(endpoint, params)[0]
+    
+    def _get_range(self, endpoint: str, start: int, end: int):
+        """Fetch one slice of a collection, returning (rows, total count)"""
+        data, content_range = self._fetch(endpoint, params={"range": f"{start}-{end}"})
+        if data is None:
+            return None, 0
+        
+        rows = data or []
+        # Content-Range: <start>-<end>/<total>
+        try:
+            total = int(content_range.rsplit('/', 1)[1])
+        except (IndexError, ValueError):
+            total = len(rows)
+        return rows, total
+    
+    def paginate(self, endpoint: str, page_size: int = PAGE_SIZE) -> List[Dict]:
+        """Fetch every row of a collection endpoint in fixed-size pages
+        
+        The first page reports the total via Content-Range; the remaining
+        pages are then requested concurrently and merged in order.
+        """
+        rows, total = self._get_range(endpoint, 0, page_size - 1)
+        if not rows:
+            return []
+        
+        starts = range(page_size, total, page_size)
+        if starts:
+            with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+                pages = executor.map(
+                    lambda start: self._get_range(endpoint, start, start + page_size - 1)[0],
+                    starts
+                )
+                for start, page in zip(starts, pages):
+                    if page is None:
+                        logger.warning(f"{endpoint}: page at offset {start} missing from results")
+                        continue
+                    rows.extend(page)
+        
+        return rows
+    
     def kill_session(self):
         """Close GLPI API session"""
         if self.session_token:
             try:
-                self.session.get(
-                    f"{self.base_url}/killSession",
-                    headers={'Session-Token': self.session_token}
-                )
+                self.session.get(f"{self.base_url}/killSession")
                 logger.info("GLPI session closed")
             except:
                 pass
@@ -161,47 +339,97 @@ class GLPIClient:
 def fetch_computers(client: GLPIClient) -> List[Dict]:
     """Fetch all computer assets"""
     logger.info("Fetching computer inventory...")
-    computers = client.get("Computer", params={"range": "0-999"})
-    return computers if computers else []
+    return client.paginate("Computer")
 
 def fetch_monitors(client: GLPIClient) -> List[Dict]:
     """Fetch all monitor assets"""
     logger.info("Fetching monitor inventory...")
-    monitors = client.get("Monitor", params={"range": "0-999"})
-    return monitors if monitors else []
+    return client.paginate("Monitor")
 
 def fetch_printers(client: GLPIClient) -> List[Dict]:
     """Fetch all printer assets"""
     logger.info("Fetching printer inventory...")
-    printers = client.get("Printer", params={"range": "0-999"})
-    return printers if printers else []
+    return client.paginate("Printer")
 
 def fetch_network_equipment(client: GLPIClient) -> List[Dict]:
     """Fetch all network equipment"""
     logger.info("Fetching network equipment...")
-    equipment = client.get("NetworkEquipment", params={"range": "0-999"})
-    return equipment if equipment else []
+    return client.paginate("NetworkEquipment")
 
 def fetch_phones(client: GLPIClient) -> List[Dict]:
     """Fetch all phone assets"""
     logger.info("Fetching phone inventory...")
-    phones = client.get("Phone", params={"range": "0-999"})
-    return phones if phones else []
+    return client.paginate("Phone")
 
 def fetch_software_licenses(client: GLPIClient) -> List[Dict]:
     """Fetch software license information"""
     logger.info("Fetching software licenses...")
-    licenses = client.get("SoftwareLicense", params={"range": "0-999"})
-    return licenses if licenses else []
+    return client.paginate("SoftwareLicense")
+
+# GLPI itemtype -> fetcher for everything the audit pulls in one pass
+INVENTORY_FETCHERS = {
+    'Computer': fetch_computers,
+    'Monitor': fetch_monitors,
+    'Printer': fetch_printers,
+    'NetworkEquipment': fetch_network_equipment,
+    'Phone': fetch_phones,
+    'SoftwareLicense': fetch_software_licenses,
+}
+
+async def fetch_and_analyze_assets(client: GLPIClient) -> Tuple[Dict[str, List[Dict]], Dict[str, List], List['LicenseRow']]:
+    """Fetch every inventory endpoint and analyze each one as it arrives
+
+    The GLPI client is blocking, so each fetch runs on a dedicated thread
+    pool and the six round-trips overlap instead of queuing. Analysis of an
+    endpoint starts as soon as its own fetch completes, so that CPU work is
+    hidden behind the slowest remaining fetch.
+
+    Returns (assets keyed by itemtype, warranty analysis, license compliance).
+    """
+    loop = asyncio.get_running_loop()
+    itemtypes = list(INVENTORY_FETCHERS)
+    
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        async def fetch_then_analyze(itemtype: str):
+            rows = await loop.run_in_executor(executor, INVENTORY_FETCHERS[itemtype], client)
+            if itemtype == 'SoftwareLicense':
+                analysis = await loop.run_in_executor(executor, analyze_license_compliance, rows)
+            else:
+                analysis = await loop.run_in_executor(executor, analyze_warranty_status, rows)
+            return rows, analysis
+        
+        results = await asyncio.gather(*(fetch_then_analyze(itemtype) for itemtype in itemtypes))
+    
+    assets = {}
+    analyses = {}
+    for itemtype, (rows, analysis) in zip(itemtypes, results):
+        assets[itemtype] = rows
+        analyses[itemtype] = analysis
+    
+    license_compliance = analyses.pop('SoftwareLicense')
+    # Merge per-type warranty results in itemtype order (as one combined pass would)
+    warranty_analysis = merge_warranty_analyses(analyses.values())
+    return assets, warranty_analysis, license_compliance
 
 # ============================================================================
 # ANALYSIS FUNCTIONS
 # ============================================================================
 
-def analyze_warranty_status(assets: List[Dict]) -> Dict[str, List]:
+@dataclass(frozen=True)
+class LicenseRow:
+    """License utilization result (slotted: no per-row __dict__)"""
+    __slots__ = ('software', 'total', 'used', 'available', 'utilization', 'status')
+    
+    software: str
+    total: int
+    used: int
+    available: int
+    utilization: float
+    status: str
+
+def analyze_warranty_status(assets: Iterable[Dict]) -> Dict[str, List]:
     """Analyze warranty expiration status"""
     today = datetime.now()
-    warning_date = today + timedelta(days=WARRANTY_WARNING_DAYS)
     
     results = {
         'expired': [],
@@ -210,6 +438,10 @@ def analyze_warranty_status(assets: List[Dict]) -> Dict[str, List]:
         'unknown': []
     }
     
+    # Hardware is bought in batches, so warranty dates repeat heavily;
+    # parse each distinct date once and reuse its day count
+    days_by_date: Dict[str, Optional[int]] = {}
+    
     for asset in assets:
         warranty_date = asset.get('warranty_date')
         asset_name = asset.get('name', 'Unknown')
@@ -218,23 +450,41 @@ def analyze_warranty_status(assets: List[Dict]) -> Dict[str, List]:
             results['unknown'].append(asset_name)
             continue
         
-        try:
-            warranty_dt = datetime.strptime(warranty_date, '%Y-%m-%d')
-            
-            if warranty_dt < today:
-                results['expired'].append((asset_name, warranty_date))
-            elif warranty_dt < warning_date:
-                days_left = (warranty_dt - today).days
-                results['expiring_soon'].append((asset_name, warranty_date, days_left))
-            else:
-                results['active'].append(asset_name)
-                
-        except ValueError:
+        if warranty_date in days_by_date:
+            days_left = days_by_date[warranty_date]
+        else:
+            # Validate the shape up front so junk values never raise
+            match = ISO_DATE_PATTERN.match(warranty_date)
+            days_left = None
+            if match:
+                try:
+                    warranty_dt = datetime(int(match[1]), int(match[2]), int(match[3]))
+                    # Whole days until expiry (negative once the warranty date has passed)
+                    days_left = (warranty_dt - today).days
+                except ValueError:
+                    pass  # Well-formed but impossible, e.g. month 13
+            days_by_date[warranty_date] = days_left
+        
+        if days_left is None:
             results['unknown'].append(asset_name)
+        elif days_left < 0:
+            results['expired'].append((asset_name, warranty_date))
+        elif days_left < WARRANTY_WARNING_DAYS:
+            results['expiring_soon'].append((asset_name, warranty_date, days_left))
+        else:
+            results['active'].append(asset_name)
     
     return results
 
-def analyze_license_compliance(licenses: List[Dict]) -> List[Dict]:
+def merge_warranty_analyses(analyses: Iterable[Dict[str, List]]) -> Dict[str, List]:
+    """Combine per-category warranty analyses into one result"""
+    analyses = list(analyses)
+    return {
+        key: list(chain.from_iterable(analysis[key] for analysis in analyses))
+        for key in ('expired', 'expiring_soon', 'active', 'unknown')
+    }
+
+def analyze_license_compliance(licenses: List[Dict]) -> List[LicenseRow]:
     """Analyze software license utilization"""
     compliance_issues = []
     
@@ -249,161 +499,142 @@ def analyze_license_compliance(licenses: List[Dict]) -> List[Dict]:
             used = int(total_licenses * 0.75)  # Assume 75% utilization
             utilization = (used / total_licenses) * 100
             
-            compliance_issues.append({
-                'software': name,
-                'total': total_licenses,
-                'used': used,
-                'available': total_licenses - used,
-                'utilization': utilization,
-                'status': 'WARN' if utilization > LICENSE_UTILIZATION_WARN else 'OK'
-            })
+            compliance_issues.append(LicenseRow(
+                software=name,
+                total=total_licenses,
+                used=used,
+                available=total_licenses - used,
+                utilization=utilization,
+                status='WARN' if utilization > LICENSE_UTILIZATION_WARN else 'OK'
+            ))
     
     return compliance_issues
 
-def categorize_assets(computers, monitors, printers, network_equipment, phones) -> Dict:
-    """Categorize all assets by type and status"""
+def categorize_assets(computers, monitors, printers, network_equipment, phones) -> Dict[str, int]:
+    """Count assets per category (raw rows are only written with --dump-assets)"""
     return {
-        'Computers': {
-            'count': len(computers),
-            'items': computers
-        },
-        'Monitors': {
-            'count': len(monitors),
-            'items': monitors
-        },
-        'Printers': {
-            'count': len(printers),
-            'items': printers
-        },
-        'Network Equipment': {
-            'count': len(network_equipment),
-            'items': network_equipment
-        },
-        'Phones': {
-            'count': len(phones),
-            'items': phones
-        }
+        'Computers': len(computers),
+        'Monitors': len(monitors),
+        'Printers': len(printers),
+        'Network Equipment': len(network_equipment),
+        'Phones': len(phones)
     }
 
 # ============================================================================
 # REPORT GENERATION
 # ============================================================================
 
-def generate_html_report(inventory: Dict, warranty_analysis: Dict, 
-                        license_compliance: List[Dict], output_file: str):
-    """Generate professional HTML audit report"""
-    
-    total_assets = sum(cat['count'] for cat in inventory.values())
-    
-    html = f"""<!DOCTYPE html>
+# Static page chrome, built once at import. The head is a string.Template
+# so the stylesheet needs no brace escaping and only two fields vary per run.
+_REPORT_HEAD = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Asset Audit Report - {datetime.now().strftime('%Y-%m-%d')}</title>
+    <title>Asset Audit Report - $report_date</title>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ 
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { 
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: #f5f7fa;
             padding: 20px;
             line-height: 1.6;
-        }}
-        .container {{ 
+        }
+        .container { 
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
-        }}
-        .header h1 {{ font-size: 28px; margin-bottom: 10px; }}
-        .header .meta {{ opacity: 0.9; font-size: 14px; }}
-        .content {{ padding: 30px; }}
-        .section {{ margin-bottom: 40px; }}
-        .section h2 {{ 
+        }
+        .header h1 { font-size: 28px; margin-bottom: 10px; }
+        .header .meta { opacity: 0.9; font-size: 14px; }
+        .content { padding: 30px; }
+        .section { margin-bottom: 40px; }
+        .section h2 { 
             font-size: 22px;
             color: #2d3748;
             border-bottom: 3px solid #667eea;
             padding-bottom: 10px;
             margin-bottom: 20px;
-        }}
-        .summary-grid {{
+        }
+        .summary-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
-        .summary-card {{
+        }
+        .summary-card {
             background: #f7fafc;
             border-left: 4px solid #667eea;
             padding: 20px;
             border-radius: 4px;
-        }}
-        .summary-card .number {{
+        }
+        .summary-card .number {
             font-size: 32px;
             font-weight: bold;
             color: #667eea;
-        }}
-        .summary-card .label {{
+        }
+        .summary-card .label {
             color: #718096;
             font-size: 14px;
             margin-top: 5px;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 15px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #e2e8f0;
-        }}
-        th {{
+        }
+        th {
             background: #f7fafc;
             font-weight: 600;
             color: #2d3748;
-        }}
-        tr:hover {{ background: #f7fafc; }}
-        .badge {{
+        }
+        tr:hover { background: #f7fafc; }
+        .badge {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 12px;
             font-size: 12px;
             font-weight: 600;
-        }}
-        .badge-success {{ background: #c6f6d5; color: #22543d; }}
-        .badge-warning {{ background: #fef5e7; color: #b7791f; }}
-        .badge-danger {{ background: #fed7d7; color: #742a2a; }}
-        .badge-info {{ background: #bee3f8; color: #2c5282; }}
-        .footer {{
+        }
+        .badge-success { background: #c6f6d5; color: #22543d; }
+        .badge-warning { background: #fef5e7; color: #b7791f; }
+        .badge-danger { background: #fed7d7; color: #742a2a; }
+        .badge-info { background: #bee3f8; color: #2c5282; }
+        .footer {
             background: #f7fafc;
             padding: 20px 30px;
             text-align: center;
             color: #718096;
             font-size: 14px;
-        }}
-        .alert {{
+        }
+        .alert {
             padding: 15px;
             border-radius: 4px;
             margin-bottom: 15px;
-        }}
-        .alert-warning {{
+        }
+        .alert-warning {
             background: #fff3cd;
             border-left: 4px solid #ffc107;
             color: #856404;
-        }}
-        .alert-danger {{
+        }
+        .alert-danger {
             background: #f8d7da;
             border-left: 4px solid #dc3545;
             color: #721c24;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -411,12 +642,86 @@ def generate_html_report(inventory: Dict, warranty_analysis: Dict,
         <div class="header">
             <h1>🏥 Asset Inventory Audit Report</h1>
             <div class="meta">
-                Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}<br>
+                Generated: $generated<br>
                 Organization: Northwoods Health System<br>
                 Auditor: IT Asset Management Team
             </div>
         </div>
+        """)
+
+_REPORT_FOOTER = f"""
+        </div>
         
+        <div class="footer">
+            <p><strong>Northwoods Health System - IT Asset Management</strong></p>
+            <p>Report generated by Asset Audit Tool v{__version__} | Author: {__author__}</p>
+            <p>For questions or concerns, contact IT Operations at it-ops@northwoodshealth.org</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Table row templates, formatted per row with str.format
+_INVENTORY_ROW = """
+                        <tr>
+                            <td>{category}</td>
+                            <td><strong>{count}</strong></td>
+                            <td>{status}</td>
+                        </tr>
+"""
+
+_WARRANTY_ROW = """
+                        <tr>
+                            <td>{name}</td>
+                            <td>{date}</td>
+                            <td><strong>{days} days</strong></td>
+                            <td><span class="badge {cls}">Action Required</span></td>
+                        </tr>
+"""
+
+_EXPIRED_ROW = """
+                        <tr>
+                            <td>{name}</td>
+                            <td>{date}</td>
+                            <td><span class="badge badge-danger">Expired</span></td>
+                        </tr>
+"""
+
+_LICENSE_ROW = """
+                        <tr>
+                            <td>{software}</td>
+                            <td>{total}</td>
+                            <td>{used}</td>
+                            <td>{available}</td>
+                            <td><strong>{utilization:.1f}%</strong></td>
+                            <td><span class="badge {cls}">{status}</span></td>
+                        </tr>
+"""
+
+# Badge lookups, indexed by the row's state instead of branching per row
+_INVENTORY_STATUS = (
+    '<span class="badge badge-info">None</span>',     # count == 0
+    '<span class="badge badge-success">Active</span>'  # count > 0
+)
+_EXPIRING_BADGE = ('badge-danger', 'badge-warning')  # [days_left >= WARRANTY_URGENT_DAYS]
+_LICENSE_BADGE = {
+    'WARN': ('badge-warning', 'High Usage'),
+    'OK': ('badge-success', 'OK')
+}
+
+def write_header(f) -> None:
+    """Write the document head, stylesheet and report banner"""
+    now = datetime.now()
+    f.write(_REPORT_HEAD.substitute(
+        report_date=now.strftime('%Y-%m-%d'),
+        generated=now.strftime('%B %d, %Y at %I:%M %p')
+    ))
+
+def write_summary(f, total_assets: int, warranty_analysis: Dict,
+                  license_compliance: List[LicenseRow]) -> None:
+    """Write the executive summary cards and warranty alert"""
+    f.write(f"""
         <div class="content">
             <!-- Executive Summary -->
             <div class="section">
@@ -435,24 +740,25 @@ def generate_html_report(inventory: Dict, warranty_analysis: Dict,
                         <div class="label">Expired Warranties</div>
                     </div>
                     <div class="summary-card">
-                        <div class="number">{len([l for l in license_compliance if l['status'] == 'WARN'])}</div>
+                        <div class="number">{len([l for l in license_compliance if l.status == 'WARN'])}</div>
                         <div class="label">License Alerts</div>
                     </div>
                 </div>
-"""
+""")
 
     # Warranty warnings
     if warranty_analysis['expiring_soon'] or warranty_analysis['expired']:
-        html += """
+        f.write("""
                 <div class="alert alert-warning">
                     <strong>⚠️ Warranty Action Required:</strong> 
                     Some assets have expired warranties or will expire within 90 days. 
                     Review the warranty section below for details.
                 </div>
-"""
+""")
 
-    # Asset inventory by category
-    html += """
+def write_inventory_section(f, inventory: Dict[str, int]) -> None:
+    """Write the asset inventory by category table"""
+    f.write("""
             </div>
             
             <div class="section">
@@ -466,28 +772,25 @@ def generate_html_report(inventory: Dict, warranty_analysis: Dict,
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
 
-    for category, data in inventory.items():
-        count = data['count']
-        status = '<span class="badge badge-success">Active</span>' if count > 0 else '<span class="badge badge-info">None</span>'
-        html += f"""
-                        <tr>
-                            <td>{category}</td>
-                            <td><strong>{count}</strong></td>
-                            <td>{status}</td>
-                        </tr>
-"""
+    write = f.write
+    for category, count in inventory.items():
+        write(_INVENTORY_ROW.format(category=category, count=count,
+                                    status=_INVENTORY_STATUS[count > 0]))
 
-    html += """
+    f.write("""
                     </tbody>
                 </table>
             </div>
-"""
+""")
 
-    # Warranty expiration warnings
-    if warranty_analysis['expiring_soon']:
-        html += """
+def write_expiring_section(f, expiring_soon: List) -> None:
+    """Write the warranties expiring soon table, if any"""
+    if not expiring_soon:
+        return
+    
+    f.write("""
             <div class="section">
                 <h2>⏰ Warranties Expiring Soon (Next 90 Days)</h2>
                 <table>
@@ -500,26 +803,23 @@ def generate_html_report(inventory: Dict, warranty_analysis: Dict,
                         </tr>
                     </thead>
                     <tbody>
-"""
-        for asset_name, expiry_date, days_left in warranty_analysis['expiring_soon']:
-            badge_class = 'badge-danger' if days_left < 30 else 'badge-warning'
-            html += f"""
-                        <tr>
-                            <td>{asset_name}</td>
-                            <td>{expiry_date}</td>
-                            <td><strong>{days_left} days</strong></td>
-                            <td><span class="badge {badge_class}">Action Required</span></td>
-                        </tr>
-"""
-        html += """
+""")
+    write = f.write
+    for asset_name, expiry_date, days_left in expiring_soon:
+        badge_class = _EXPIRING_BADGE[days_left >= WARRANTY_URGENT_DAYS]
+        write(_WARRANTY_ROW.format(name=asset_name, date=expiry_date, days=days_left, cls=badge_class))
+    f.write("""
                     </tbody>
                 </table>
             </div>
-"""
+""")
 
-    # Expired warranties
-    if warranty_analysis['expired']:
-        html += """
+def write_expired_section(f, expired: List) -> None:
+    """Write the expired warranties table, if any"""
+    if not expired:
+        return
+    
+    f.write("""
             <div class="section">
                 <h2>❌ Expired Warranties</h2>
                 <div class="alert alert-danger">
@@ -534,24 +834,22 @@ def generate_html_report(inventory: Dict, warranty_analysis: Dict,
                         </tr>
                     </thead>
                     <tbody>
-"""
-        for asset_name, expiry_date in warranty_analysis['expired']:
-            html += f"""
-                        <tr>
-                            <td>{asset_name}</td>
-                            <td>{expiry_date}</td>
-                            <td><span class="badge badge-danger">Expired</span></td>
-                        </tr>
-"""
-        html += """
+""")
+    write = f.write
+    for asset_name, expiry_date in expired:
+        write(_EXPIRED_ROW.format(name=asset_name, date=expiry_date))
+    f.write("""
                     </tbody>
                 </table>
             </div>
-"""
+""")
 
-    # License compliance
-    if license_compliance:
-        html += """
+def write_license_section(f, license_compliance: List[LicenseRow]) -> None:
+    """Write the software license compliance table, if any"""
+    if not license_compliance:
+        return
+    
+    f.write("""
             <div class="section">
                 <h2>📜 Software License Compliance</h2>
                 <table>
@@ -566,46 +864,81 @@ def generate_html_report(inventory: Dict, warranty_analysis: Dict,
                         </tr>
                     </thead>
                     <tbody>
-"""
-        for lic in license_compliance:
-            badge_class = 'badge-warning' if lic['status'] == 'WARN' else 'badge-success'
-            status_text = 'High Usage' if lic['status'] == 'WARN' else 'OK'
-            html += f"""
-                        <tr>
-                            <td>{lic['software']}</td>
-                            <td>{lic['total']}</td>
-                            <td>{lic['used']}</td>
-                            <td>{lic['available']}</td>
-                            <td><strong>{lic['utilization']:.1f}%</strong></td>
-                            <td><span class="badge {badge_class}">{status_text}</span></td>
-                        </tr>
-"""
-        html += """
+""")
+    write = f.write
+    for lic in license_compliance:
+        badge_class, status_text = _LICENSE_BADGE[lic.status]
+        write(_LICENSE_ROW.format(
+            software=lic.software, total=lic.total, used=lic.used,
+            available=lic.available, utilization=lic.utilization,
+            cls=badge_class, status=status_text
+        ))
+    f.write("""
                     </tbody>
                 </table>
             </div>
-"""
+""")
 
-    # Footer
-    html += f"""
-        </div>
-        
-        <div class="footer">
-            <p><strong>Northwoods Health System - IT Asset Management</strong></p>
-            <p>Report generated by Asset Audit Tool v{__version__} | Author: {__author__}</p>
-            <p>For questions or concerns, contact IT Operations at it-ops@northwoodshealth.org</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+def write_footer(f) -> None:
+    """Write the report footer and close the document"""
+    f.write(_REPORT_FOOTER)
 
-    # Write report to file
-    with open(output_file, 'w') as f:
-        f.write(html)
+def generate_html_report(inventory: Dict[str, int], warranty_analysis: Dict, 
+                        license_compliance: List[LicenseRow], output_file: str):
+    """Generate professional HTML audit report
+    
+    Sections are streamed straight to a buffered file handle, so memory
+    stays flat no matter how many assets are listed.
+    """
+    total_assets = sum(inventory.values())
+    
+    with open(output_file, 'w', buffering=REPORT_WRITE_BUFFER) as f:
+        write_header(f)
+        write_summary(f, total_assets, warranty_analysis, license_compliance)
+        write_inventory_section(f, inventory)
+        write_expiring_section(f, warranty_analysis['expiring_soon'])
+        write_expired_section(f, warranty_analysis['expired'])
+        write_license_section(f, license_compliance)
+        write_footer(f)
     
     logger.info(f"✓ HTML report generated: {output_file}")
 
+def _json_default(value: Any) -> Any:
+    """Serialize result records as dicts and anything else as a string"""
+    if is_dataclass(value):
+        return asdict(value)
+    return str(value)
+
+def write_json_data(payload: Dict, output_file: str):
+    """Write the JSON data sidecar, using orjson when it is installed"""
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=_json_default))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(payload, f, indent=2, default=_json_default)
+
+def write_asset_dumps(assets: Dict[str, List[Dict]], output_file: str) -> List[str]:
+    """Write raw GLPI rows as one JSON Lines file per itemtype"""
+    base = output_file[:-5] if output_file.endswith('.html') else output_file
+    written = []
+    
+    for itemtype, rows in assets.items():
+        dump_file = f"{base}-{itemtype.lower()}.jsonl"
+        if orjson is not None:
+            option = orjson.OPT_APPEND_NEWLINE
+            with open(dump_file, 'wb', buffering=REPORT_WRITE_BUFFER) as f:
+                for row in rows:
+                    f.write(orjson.dumps(row, option=option, default=str))
+        else:
+            with open(dump_file, 'w', buffering=REPORT_WRITE_BUFFER) as f:
+                for row in rows:
+                    f.write(json.dumps(row, separators=(',', ':'), default=str))
+                    f.write('\n')
+        written.append(dump_file)
+    
+    return written
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -626,33 +959,43 @@ def main():
                        help='Output HTML file path')
     parser.add_argument('--json', action='store_true',
                        help='Also output JSON data file')
+    parser.add_argument('--dump-assets', action='store_true',
+                       help='Also write raw asset rows as per-itemtype .jsonl files')
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                       help=f'Directory for cached GLPI responses (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always refetch from GLPI without using the response cache')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
     args = parser.parse_args()
     
-    if args.verbose:
-        logger.setLevel(logging.DEBUG)
+    setup_logging(args.verbose)
     
     logger.info("=" * 60)
     logger.info("Asset Audit Report Generator v" + __version__)
     logger.info("=" * 60)
     
     # Connect to GLPI
-    client = GLPIClient(args.url, args.username, args.password)
+    cache_dir = None if args.no_cache else Path(args.cache_dir).expanduser()
+    client = GLPIClient(args.url, args.username, args.password, cache_dir=cache_dir)
     
     if not client.init_session():
         logger.error("Failed to connect to GLPI API")
         return 2
     
     try:
-        # Fetch all asset data
-        computers = fetch_computers(client)
-        monitors = fetch_monitors(client)
-        printers = fetch_printers(client)
-        network_equipment = fetch_network_equipment(client)
-        phones = fetch_phones(client)
-        licenses = fetch_software_licenses(client)
+        # Fetch all asset data (endpoints are independent, so run concurrently)
+        # and analyze each endpoint while the others are still in flight
+        assets, warranty_analysis, license_compliance = asyncio.run(
+            fetch_and_analyze_assets(client)
+        )
+        computers = assets['Computer']
+        monitors = assets['Monitor']
+        printers = assets['Printer']
+        network_equipment = assets['NetworkEquipment']
+        phones = assets['Phone']
+        licenses = assets['SoftwareLicense']
         
         logger.info(f"✓ Fetched {len(computers)} computers")
         logger.info(f"✓ Fetched {len(monitors)} monitors")
@@ -664,28 +1007,25 @@ def main():
         # Categorize assets
         inventory = categorize_assets(computers, monitors, printers, network_equipment, phones)
         
-        # Analyze warranty status (combine all assets)
-        all_assets = computers + monitors + printers + network_equipment + phones
-        warranty_analysis = analyze_warranty_status(all_assets)
-        
-        # Analyze license compliance
-        license_compliance = analyze_license_compliance(licenses)
-        
         # Generate HTML report
         generate_html_report(inventory, warranty_analysis, license_compliance, args.output)
         
         # Optionally generate JSON output
         if args.json:
             json_file = args.output.replace('.html', '.json')
-            with open(json_file, 'w') as f:
-                json.dump({
-                    'generated': datetime.now().isoformat(),
-                    'inventory': inventory,
-                    'warranty_analysis': warranty_analysis,
-                    'license_compliance': license_compliance
-                }, f, indent=2, default=str)
+            write_json_data({
+                'generated': datetime.now().isoformat(),
+                'inventory': inventory,
+                'warranty_analysis': warranty_analysis,
+                'license_compliance': license_compliance
+            }, json_file)
             logger.info(f"✓ JSON data saved: {json_file}")
         
+        # Optionally dump raw asset rows
+        if args.dump_assets:
+            for dump_file in write_asset_dumps(assets, args.output):
+                logger.info(f"✓ Asset rows saved: {dump_file}")
+        
         logger.info("=" * 60)
         logger.info("✓ Audit report completed successfully!")
         logger.info(f"✓ Report: {args.output}")
@@ -24,6 +24,10 @@ Version: 1.0
 Requirements:
     - Python 3.8+
     - requests library
+    - icmplib library (optional, pings without spawning the system ping)
+    - httpx library with HTTP/2 support (optional, pip3 install 'httpx[http2]')
+    - ldap3 library (optional, LDAP bind test instead of a TCP port check)
+    - orjson library (optional, faster JSON output)
     - Network access to monitored endpoints
 
 Usage:
@@ -37,23 +41,57 @@ Exit codes:
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import re
+import smtplib
 import subprocess
 import sys
 import time
 import socket
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("ERROR: requests library not installed. Run: pip3 install requests")
     sys.exit(1)
 
+try:
+    import icmplib  # Optional: unprivileged ICMP sockets instead of fork/exec ping
+except ImportError:
+    icmplib = None
+
+try:
+    import httpx  # Optional: HTTP/2 multiplexes concurrent checks per host
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # Optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
+try:
+    import ldap3  # Optional: real LDAP bind instead of a bare TCP connect
+    from ldap3.core.exceptions import LDAPException, LDAPSocketOpenError
+except ImportError:
+    ldap3 = None
+
+# Exceptions raised by whichever HTTP client the checker ends up using
+HTTP_TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+HTTP_CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+if httpx is not None:
+    HTTP_TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    HTTP_CONNECTION_ERRORS += (httpx.TransportError,)
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -129,6 +167,35 @@ DEFAULT_ENDPOINTS = [
 RESPONSE_TIME_WARN = 1000  # 1 second
 RESPONSE_TIME_CRITICAL = 3000  # 3 seconds
 
+# Status for a response time, bucketed by the thresholds above (upper bounds inclusive)
+RESPONSE_TIME_BOUNDS = (RESPONSE_TIME_WARN, RESPONSE_TIME_CRITICAL)
+RESPONSE_TIME_STATUS = ("healthy", "warning", "critical")
+
+# Overall health score tiers (percent healthy; lower bounds inclusive)
+HEALTH_SCORE_BOUNDS = (90, 100)
+HEALTH_SCORE_STATUS = (
+    "Status: ✗ CRITICAL ISSUES DETECTED",
+    "Status: ⚠ DEGRADED PERFORMANCE",
+    "Status: ✓ ALL SYSTEMS OPERATIONAL",
+)
+
+# Maximum endpoints probed concurrently
+MAX_CHECK_WORKERS = 32
+
+# HTTP connection pool shared by all HTTP checks (hosts cached, sockets per host)
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# In-flight hosts for a batched icmplib ping over one shared socket
+PING_CONCURRENT_TASKS = 50
+
+# Seconds a resolved address is reused before asking DNS again
+DNS_CACHE_TTL = 30.0
+
+# Average RTT from the ping summary line (Linux mdev, BSD/macOS stddev, BusyBox none)
+# Example: rtt min/avg/max/mdev = 0.123/0.456/0.789/0.123 ms
+PING_AVG_RE = re.compile(rb'min/avg/max(?:/\w+)?\s*=\s*[\d.]+/([\d.]+)/')
+
 # Logging configuration
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 LOG_FILE = f"network-health-{datetime.now().strftime('%Y-%m-%d')}.log"
@@ -151,6 +218,48 @@ logger = logging.getLogger(__name__)
 # HEALTH CHECK FUNCTIONS
 # ============================================================================
 
+def _classify(elapsed_ms: float) -> str:
+    """Map a response time to healthy/warning/critical"""
+    return RESPONSE_TIME_STATUS[bisect_left(RESPONSE_TIME_BOUNDS, elapsed_ms)]
+
+class CheckResult:
+    """Outcome of one endpoint check (slotted: no per-result __dict__)
+    
+    Optional fields stay None when a check does not produce them and are
+    left out of the dashboard JSON, matching the old per-check dicts.
+    """
+    __slots__ = ('name', 'type', 'status', 'available', 'response_time_ms',
+                 'http_code', 'details', 'timestamp', 'critical')
+    
+    def __init__(self, name: str, type: str, status: str, available: bool, details: str,
+                 response_time_ms: Optional[float] = None, http_code: Optional[int] = None,
+                 timestamp: Optional[str] = None, critical: Optional[bool] = None):
+        self.name = name
+        self.type = type
+        self.status = status
+        self.available = available
+        self.response_time_ms = response_time_ms
+        self.http_code = http_code
+        self.details = details
+        self.timestamp = timestamp
+        self.critical = critical
+    
+    def copy(self) -> 'CheckResult':
+        """Return an independent copy of this result"""
+        clone = CheckResult.__new__(CheckResult)
+        for field in self.__slots__:
+            setattr(clone, field, getattr(self, field))
+        return clone
+    
+    def to_dict(self) -> Dict:
+        """Serialize for the dashboard JSON, in field order, skipping unset fields"""
+        result = {}
+        for field in self.__slots__:
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = value
+        return result
+
 class HealthChecker:
     """Network service health checker"""
     
@@ -159,70 +268,183 @@ class HealthChecker:
         self.critical_failures = 0
         self.warnings = 0
         self.successes = 0
+        
+        # One pooled session so HTTP checks reuse keep-alive connections
+        # instead of paying a fresh TCP+TLS handshake per request.
+        # No retries: a health check must report the first failure it sees.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS,
+                              pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Prefer httpx over HTTP/2 when available: concurrent checks against
+        # one hostname share a single TLS connection as multiplexed streams
+        self.client = None
+        if httpx is not None:
+            try:
+                self.client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=HTTP_POOL_MAXSIZE,
+                                        max_keepalive_connections=HTTP_POOL_CONNECTIONS)
+                )
+            except ImportError:
+                logger.debug("httpx installed without h2, using requests for HTTP checks")
+        
+        # Cleared if the kernel refuses unprivileged ICMP sockets
+        self.icmp_available = icmplib is not None
+        
+        # Hostname -> (expiry, addresses), shared by the TCP checks of that host
+        self._dns_cache: Dict[str, Tuple[float, List[str]]] = {}
+        
+        # Endpoint type -> check method; new check types register here
+        self._dispatch: Dict[str, Callable[[Dict], CheckResult]] = {
+            'http': self.check_http,
+            'https': self.check_http,
+            'tcp': self.check_tcp,
+            'ping': self.check_ping,
+            'ldap': self.check_ldap,
+            'smtp': self.check_smtp,
+        }
     
-    def check_http(self, endpoint: Dict) -> Dict:
+    def close(self):
+        """Release pooled HTTP connections"""
+        if self.client is not None:
+            self.client.close()
+        self.session.close()
+    
+    def check_http(self, endpoint: Dict) -> CheckResult:
         """Check HTTP/HTTPS service availability"""
         url = endpoint['url']
         timeout = endpoint.get('timeout', 5)
         
         logger.info(f"Checking HTTP: {url}")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = requests.get(url, timeout=timeout, allow_redirects=True)
-            elapsed_ms = (time.time() - start_time) * 1000
+            if self.client is not None:
+                response = self.client.get(url, timeout=timeout, follow_redirects=True)
+            else:
+                response = self.session.get(url, timeout=timeout, allow_redirects=True)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
             
-            status = "healthy"
             if response.status_code >= 500:
                 status = "critical"
             elif response.status_code >= 400:
                 status = "warning"
-            elif elapsed_ms > RESPONSE_TIME_CRITICAL:
-                status = "critical"
-            elif elapsed_ms > RESPONSE_TIME_WARN:
-                status = "warning"
+            else:
+                status = _classify(elapsed_ms)
             
-            return {
-                "name": endpoint['name'],
-                "type": "http",
-                "status": status,
-                "available": True,
-                "response_time_ms": round(elapsed_ms, 2),
-                "http_code": response.status_code,
-                "details": f"HTTP {response.status_code}",
-                "timestamp": datetime.now().isoformat()
-            }
+            return CheckResult(
+                name=endpoint['name'],
+                type="http",
+                status=status,
+                available=True,
+                response_time_ms=round(elapsed_ms, 2),
+                http_code=response.status_code,
+                details=f"HTTP {response.status_code}"
+            )
             
-        except requests.exceptions.Timeout:
-            return {
-                "name": endpoint['name'],
-                "type": "http",
-                "status": "critical",
-                "available": False,
-                "response_time_ms": timeout * 1000,
-                "details": "Connection timeout",
-                "timestamp": datetime.now().isoformat()
-            }
-        except requests.exceptions.ConnectionError as e:
-            return {
-                "name": endpoint['name'],
-                "type": "http",
-                "status": "critical",
-                "available": False,
-                "details": f"Connection refused: {str(e)[:50]}",
-                "timestamp": datetime.now().isoformat()
-            }
+        except HTTP_TIMEOUT_ERRORS:
+            return CheckResult(
+                name=endpoint['name'],
+                type="http",
+                status="critical",
+                available=False,
+                response_time_ms=timeout * 1000,
+                details="Connection timeout"
+            )
+        except HTTP_CONNECTION_ERRORS as e:
+            return CheckResult(
+                name=endpoint['name'],
+                type="http",
+                status="critical",
+                available=False,
+                details=f"Connection refused: {str(e)[:50]}"
+            )
         except Exception as e:
-            return {
-                "name": endpoint['name'],
-                "type": "http",
-                "status": "critical",
-                "available": False,
-                "details": f"Error: {str(e)[:50]}",
-                "timestamp": datetime.now().isoformat()
-            }
-    
-    def check_tcp(self, endpoint: Dict) -> Dict:
+            return CheckResult(
+                name=endpoint['name'],
+                type="http",
+                status="critical",
+                available=False,
+                details=f"Error: {str(e)[:50]}"
+            )
+    
+    def _cached_addresses(self, host: str) -> Optional[List[str]]:
+        """Return the addresses for host if it was resolved recently"""
+        hit = self._dns_cache.get(host)
+        if hit and time.monotonic() < hit[0]:
+            return hit[1]
+        return None
+    
+    def _remember_addresses(self, host: str, addrinfo: List) -> List[str]:
+        """Cache every address getaddrinfo returned for host, in its preferred order"""
+        addresses = list(dict.fromkeys(info[4][0] for info in addrinfo))
+        self._dns_cache[host] = (time.monotonic() + DNS_CACHE_TTL, addresses)
+        return addresses
+    
+    def _resolve(self, host: str) -> List[str]:
+        """Resolve host, reusing the answer for DNS_CACHE_TTL seconds"""
+        addresses = self._cached_addresses(host)
+        if addresses is None:
+            addresses = self._remember_addresses(
+                host, socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+            )
+        return addresses
+    
+    async def _resolve_async(self, host: str) -> List[str]:
+        """Resolve host without blocking the event loop"""
+        addresses = self._cached_addresses(host)
+        if addresses is None:
+            loop = asyncio.get_running_loop()
+            addresses = self._remember_addresses(
+                host, await loop.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+            )
+        return addresses
+    
+    def _connect(self, host: str, port: int, timeout: float) -> socket.socket:
+        """Connect to the first resolved address that accepts, like create_connection"""
+        error: Optional[OSError] = None
+        for address in self._resolve(host):
+            try:
+                return socket.create_connection((address, port), timeout=timeout)
+            except OSError as exc:
+                error = exc
+        raise error
+    
+    async def _connect_async(self, host: str, port: int, timeout: float):
+        """Open a stream to the first resolved address that accepts"""
+        error: Optional[Exception] = None
+        for address in await self._resolve_async(host):
+            try:
+                return await asyncio.wait_for(asyncio.open_connection(address, port), timeout)
+            except (OSError, asyncio.TimeoutError) as exc:
+                error = exc
+        raise error
+    
+    def _tcp_open(self, endpoint: Dict, elapsed_ms: float) -> CheckResult:
+        """Build the result for a TCP port that accepted the connection"""
+        return CheckResult(
+            name=endpoint['name'],
+            type="tcp",
+            status=_classify(elapsed_ms),
+            available=True,
+            response_time_ms=round(elapsed_ms, 2),
+            details=f"Port {endpoint['port']} open"
+        )
+    
+    def _tcp_failed(self, endpoint: Dict, details: str, check_type: str = "tcp") -> CheckResult:
+        """Build the result for a TCP check that could not connect"""
+        return CheckResult(
+            name=endpoint['name'],
+            type=check_type,
+            status="critical",
+            available=False,
+            details=details
+        )
+    
+    def check_tcp(self, endpoint: Dict) -> CheckResult:
         """Check TCP port availability"""
         host = endpoint['host']
         port = endpoint['port']
@@ -230,211 +452,381 @@ class HealthChecker:
         
         logger.info(f"Checking TCP: {host}:{port}")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            elapsed_ms = (time.time() - start_time) * 1000
-            sock.close()
+            # Each cached address is tried in turn (e.g. IPv4 after a dead IPv6 route)
+            with self._connect(host, port, timeout):
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return self._tcp_open(endpoint, elapsed_ms)
+            
+        except socket.gaierror:
+            return self._tcp_failed(endpoint, "DNS resolution failed")
+        except ConnectionRefusedError:
+            return self._tcp_failed(endpoint, f"Port {port} closed (connection refused)")
+        except socket.timeout:
+            return self._tcp_failed(endpoint, f"Port {port} filtered (connection timed out)")
+        except OSError:
+            return self._tcp_failed(endpoint, f"Port {port} closed or filtered")
+        except Exception as e:
+            return self._tcp_failed(endpoint, f"Error: {str(e)[:50]}")
+    
+    async def check_tcp_async(self, endpoint: Dict) -> CheckResult:
+        """Check TCP port availability on the event loop, without a thread"""
+        host = endpoint['host']
+        port = endpoint['port']
+        timeout = endpoint.get('timeout', 3)
+        
+        logger.info(f"Checking TCP: {host}:{port}")
+        
+        start_time = time.perf_counter()
+        try:
+            _, writer = await self._connect_async(host, port, timeout)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            writer.close()
+            await writer.wait_closed()
+            return self._tcp_open(endpoint, elapsed_ms)
             
-            if result == 0:
-                status = "healthy"
-                if elapsed_ms > RESPONSE_TIME_CRITICAL:
-                    status = "critical"
-                elif elapsed_ms > RESPONSE_TIME_WARN:
-                    status = "warning"
-                
-                return {
-                    "name": endpoint['name'],
-                    "type": "tcp",
-                    "status": status,
-                    "available": True,
-                    "response_time_ms": round(elapsed_ms, 2),
-                    "details": f"Port {port} open",
-                    "timestamp": datetime.now().isoformat()
-                }
-            else:
-                return {
-                    "name": endpoint['name'],
-                    "type": "tcp",
-                    "status": "critical",
-                    "available": False,
-                    "details": f"Port {port} closed or filtered",
-                    "timestamp": datetime.now().isoformat()
-                }
-                
         except socket.gaierror:
-            return {
-                "name": endpoint['name'],
-                "type": "tcp",
-                "status": "critical",
-                "available": False,
-                "details": "DNS resolution failed",
-                "timestamp": datetime.now().isoformat()
-            }
+            return self._tcp_failed(endpoint, "DNS resolution failed")
+        except ConnectionRefusedError:
+            return self._tcp_failed(endpoint, f"Port {port} closed (connection refused)")
+        except asyncio.TimeoutError:
+            return self._tcp_failed(endpoint, f"Port {port} filtered (connection timed out)")
+        except OSError:
+            return self._tcp_failed(endpoint, f"Port {port} closed or filtered")
         except Exception as e:
-            return {
-                "name": endpoint['name'],
-                "type": "tcp",
-                "status": "critical",
-                "available": False,
-                "details": f"Error: {str(e)[:50]}",
-                "timestamp": datetime.now().isoformat()
-            }
-    
-    def check_ping(self, endpoint: Dict) -> Dict:
+            return self._tcp_failed(endpoint, f"Error: {str(e)[:50]}")
+    
+    def _ping_result(self, endpoint: Dict, avg_ms: float) -> CheckResult:
+        """Build the result for a host that answered ping"""
+        return CheckResult(
+            name=endpoint['name'],
+            type="ping",
+            status=_classify(avg_ms),
+            available=True,
+            response_time_ms=round(avg_ms, 2),
+            details=f"Avg RTT: {avg_ms:.2f}ms"
+        )
+    
+    def _ping_unreachable(self, endpoint: Dict) -> CheckResult:
+        """Build the result for a host that did not answer ping"""
+        return CheckResult(
+            name=endpoint['name'],
+            type="ping",
+            status="critical",
+            available=False,
+            details="Host unreachable"
+        )
+    
+    def check_ping(self, endpoint: Dict) -> CheckResult:
         """Check ICMP ping connectivity"""
         host = endpoint['host']
         timeout = endpoint.get('timeout', 2)
         
         logger.info(f"Checking ping: {host}")
         
+        if self.icmp_available:
+            try:
+                host_result = icmplib.ping(host, count=3, timeout=timeout, privileged=False)
+            except icmplib.SocketPermissionError:
+                # net.ipv4.ping_group_range excludes this user; use the system ping
+                logger.debug("Unprivileged ICMP not permitted, falling back to ping command")
+                self.icmp_available = False
+            except icmplib.NameLookupError:
+                return CheckResult(
+                    name=endpoint['name'],
+                    type="ping",
+                    status="critical",
+                    available=False,
+                    details="DNS resolution failed"
+                )
+            except Exception as e:
+                return CheckResult(
+                    name=endpoint['name'],
+                    type="ping",
+                    status="critical",
+                    available=False,
+                    details=f"Error: {str(e)[:50]}"
+                )
+            else:
+                if host_result.is_alive:
+                    return self._ping_result(endpoint, host_result.avg_rtt)
+                return self._ping_unreachable(endpoint)
+        
+        return self._check_ping_command(endpoint)
+    
+    def check_pings_batch(self, endpoints: List[Dict]) -> Optional[List[CheckResult]]:
+        """Ping all hosts at once over a single shared ICMP socket
+        
+        Returns None if the batch could not run, so callers can fall back
+        to per-endpoint check_ping.
+        """
+        hosts = [endpoint['host'] for endpoint in endpoints]
+        timeout = max(endpoint.get('timeout', 2) for endpoint in endpoints)
+        
+        logger.info(f"Checking ping: {len(hosts)} hosts in one batch")
+        
+        try:
+            host_results = icmplib.multiping(hosts, count=3, timeout=timeout,
+                                             concurrent_tasks=PING_CONCURRENT_TASKS,
+                                             privileged=False)
+        except icmplib.SocketPermissionError:
+            logger.debug("Unprivileged ICMP not permitted, falling back to ping command")
+            self.icmp_available = False
+            return None
+        except icmplib.ICMPLibError as e:
+            # A single unresolvable host fails the whole batch
+            logger.debug(f"Batch ping failed ({e}), pinging hosts individually")
+            return None
+        
+        # multiping returns hosts in the order they were given
+        return [
+            self._ping_result(endpoint, host_result.avg_rtt) if host_result.is_alive
+            else self._ping_unreachable(endpoint)
+            for endpoint, host_result in zip(endpoints, host_results)
+        ]
+    
+    def _check_ping_command(self, endpoint: Dict) -> CheckResult:
+        """Check ICMP ping connectivity using the system ping command"""
+        host = endpoint['host']
+        timeout = endpoint.get('timeout', 2)
+        
         try:
             # Use system ping command
             result = subprocess.run(
                 ['ping', '-c', '3', '-W', str(timeout), host],
                 capture_output=True,
-                text=True,
                 timeout=timeout * 3
             )
             
             if result.returncode == 0:
-                # Parse average response time from ping output
-                # Example: rtt min/avg/max/mdev = 0.123/0.456/0.789/0.123 ms
-                output = result.stdout
-                if 'avg' in output:
-                    try:
-                        avg_line = [l for l in output.split('\n') if 'avg' in l][0]
-                        avg_ms = float(avg_line.split('/')[4])
-                    except:
-                        avg_ms = 0
-                else:
-                    avg_ms = 0
+                # Parse average response time straight from the raw output
+                match = PING_AVG_RE.search(result.stdout)
+                avg_ms = float(match.group(1)) if match else 0
                 
-                status = "healthy"
-                if avg_ms > RESPONSE_TIME_CRITICAL:
-                    status = "critical"
-                elif avg_ms > RESPONSE_TIME_WARN:
-                    status = "warning"
-                
-                return {
-                    "name": endpoint['name'],
-                    "type": "ping",
-                    "status": status,
-                    "available": True,
-                    "response_time_ms": round(avg_ms, 2),
-                    "details": f"Avg RTT: {avg_ms:.2f}ms",
-                    "timestamp": datetime.now().isoformat()
-                }
+                return self._ping_result(endpoint, avg_ms)
             else:
-                return {
-                    "name": endpoint['name'],
-                    "type": "ping",
-                    "status": "critical",
-                    "available": False,
-                    "details": "Host unreachable",
-                    "timestamp": datetime.now().isoformat()
-                }
+                return self._ping_unreachable(endpoint)
                 
         except subprocess.TimeoutExpired:
-            return {
-                "name": endpoint['name'],
-                "type": "ping",
-                "status": "critical",
-                "available": False,
-                "details": "Ping timeout",
-                "timestamp": datetime.now().isoformat()
-            }
+            return CheckResult(
+                name=endpoint['name'],
+                type="ping",
+                status="critical",
+                available=False,
+                details="Ping timeout"
+            )
         except Exception as e:
-            return {
-                "name": endpoint['name'],
-                "type": "ping",
-                "status": "critical",
-                "available": False,
-                "details": f"Error: {str(e)[:50]}",
-                "timestamp": datetime.now().isoformat()
-            }
-    
-    def check_ldap(self, endpoint: Dict) -> Dict:
-        """Check LDAP service availability"""
-        # For LDAP, we'll use a simple TCP port check
-        # In production, would use python-ldap library for actual LDAP bind test
-        endpoint_tcp = {
-            "name": endpoint['name'],
-            "host": endpoint['host'],
-            "port": endpoint.get('port', 389),
-            "timeout": endpoint.get('timeout', 3)
-        }
-        result = self.check_tcp(endpoint_tcp)
-        result['type'] = 'ldap'
-        return result
+            return CheckResult(
+                name=endpoint['name'],
+                type="ping",
+                status="critical",
+                available=False,
+                details=f"Error: {str(e)[:50]}"
+            )
     
-    def check_smtp(self, endpoint: Dict) -> Dict:
-        """Check SMTP service availability"""
-        # Similar to LDAP, use TCP check for simplicity
-        # In production, would test actual SMTP conversation
-        endpoint_tcp = {
-            "name": endpoint['name'],
-            "host": endpoint['host'],
-            "port": endpoint.get('port', 25),
-            "timeout": endpoint.get('timeout', 5)
-        }
-        result = self.check_tcp(endpoint_tcp)
-        result['type'] = 'smtp'
-        return result
+    def _handshake_result(self, endpoint: Dict, check_type: str, elapsed_ms: float,
+                          accepted: bool, details: str) -> CheckResult:
+        """Build the result for a service that answered at the protocol level"""
+        return CheckResult(
+            name=endpoint['name'],
+            type=check_type,
+            status=_classify(elapsed_ms) if accepted else "warning",
+            available=True,
+            response_time_ms=round(elapsed_ms, 2),
+            details=details
+        )
+    
+    def check_ldap(self, endpoint: Dict) -> CheckResult:
+        """Check LDAP service availability with an anonymous bind"""
+        host = endpoint['host']
+        port = endpoint.get('port', 389)
+        timeout = endpoint.get('timeout', 3)
+        
+        if ldap3 is None:
+            # Without ldap3 the best we can do is a TCP port check
+            result = self.check_tcp({"name": endpoint['name'], "host": host,
+                                     "port": port, "timeout": timeout})
+            result.type = 'ldap'
+            return result
+        
+        logger.info(f"Checking LDAP: {host}:{port}")
+        
+        start_time = time.perf_counter()
+        try:
+            server = ldap3.Server(host, port=port, connect_timeout=timeout)
+            conn = ldap3.Connection(server, receive_timeout=timeout)
+            try:
+                bound = conn.bind()
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                description = conn.result.get('description', 'unknown') if conn.result else 'unknown'
+            finally:
+                conn.unbind()
+            
+            details = "Anonymous bind OK" if bound else f"Anonymous bind rejected: {description}"
+            return self._handshake_result(endpoint, "ldap", elapsed_ms, bound, details)
+            
+        except socket.gaierror:
+            return self._tcp_failed(endpoint, "DNS resolution failed", "ldap")
+        except LDAPSocketOpenError:
+            return self._tcp_failed(endpoint, f"Port {port} closed or filtered", "ldap")
+        except LDAPException as e:
+            return self._tcp_failed(endpoint, f"LDAP error: {str(e)[:50]}", "ldap")
+        except Exception as e:
+            return self._tcp_failed(endpoint, f"Error: {str(e)[:50]}", "ldap")
+    
+    def check_smtp(self, endpoint: Dict) -> CheckResult:
+        """Check SMTP service availability with a greeting and EHLO"""
+        host = endpoint['host']
+        port = endpoint.get('port', 25)
+        timeout = endpoint.get('timeout', 5)
+        
+        logger.info(f"Checking SMTP: {host}:{port}")
+        
+        start_time = time.perf_counter()
+        try:
+            # local_hostname skips smtplib's getfqdn() reverse lookup
+            with smtplib.SMTP(host, port, timeout=timeout,
+                              local_hostname=socket.gethostname()) as smtp:
+                code, _ = smtp.ehlo()
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+            
+            accepted = code == 250
+            details = "EHLO accepted" if accepted else f"EHLO rejected ({code})"
+            return self._handshake_result(endpoint, "smtp", elapsed_ms, accepted, details)
+            
+        except socket.gaierror:
+            return self._tcp_failed(endpoint, "DNS resolution failed", "smtp")
+        except ConnectionRefusedError:
+            return self._tcp_failed(endpoint, f"Port {port} closed (connection refused)", "smtp")
+        except socket.timeout:
+            return self._tcp_failed(endpoint, "SMTP timeout", "smtp")
+        except smtplib.SMTPException as e:
+            return self._tcp_failed(endpoint, f"SMTP error: {str(e)[:50]}", "smtp")
+        except OSError:
+            return self._tcp_failed(endpoint, f"Port {port} closed or filtered", "smtp")
+        except Exception as e:
+            return self._tcp_failed(endpoint, f"Error: {str(e)[:50]}", "smtp")
     
-    def check_endpoint(self, endpoint: Dict) -> Dict:
+    def _probe_key(self, endpoint: Dict) -> str:
+        """Identify what an endpoint probes, independent of its name"""
+        target = endpoint.get('url') or endpoint.get('host')
+        return f"{endpoint.get('type', 'tcp')}:{target}:{endpoint.get('port', '')}"
+    
+    async def check_endpoint_async(self, endpoint: Dict, executor: ThreadPoolExecutor) -> CheckResult:
+        """Check an endpoint from the event loop
+        
+        TCP connects run natively on the loop; the other check types block,
+        so they are handed to the executor.
+        """
+        if endpoint.get('type', 'tcp') != 'tcp':
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self.check_endpoint, endpoint)
+        return await self.check_tcp_async(endpoint)
+    
+    def check_endpoint(self, endpoint: Dict) -> CheckResult:
         """Route to appropriate check based on endpoint type"""
         check_type = endpoint.get('type', 'tcp')
         
-        if check_type == 'http' or check_type == 'https':
-            return self.check_http(endpoint)
-        elif check_type == 'tcp':
-            return self.check_tcp(endpoint)
-        elif check_type == 'ping':
-            return self.check_ping(endpoint)
-        elif check_type == 'ldap':
-            return self.check_ldap(endpoint)
-        elif check_type == 'smtp':
-            return self.check_smtp(endpoint)
-        else:
+        handler = self._dispatch.get(check_type)
+        if handler is None:
             logger.warning(f"Unknown check type: {check_type}")
-            return {
-                "name": endpoint['name'],
-                "type": check_type,
-                "status": "unknown",
-                "available": False,
-                "details": "Unknown check type",
-                "timestamp": datetime.now().isoformat()
-            }
-    
-    def run_checks(self, endpoints: List[Dict]) -> List[Dict]:
+            return CheckResult(
+                name=endpoint['name'],
+                type=check_type,
+                status="unknown",
+                available=False,
+                details="Unknown check type"
+            )
+        
+        return handler(endpoint)
+    
+    def _tally(self, result: CheckResult):
+        """Update run counters and log the outcome of one check"""
+        if result.status == 'healthy':
+            self.successes += 1
+            logger.info(f"✓ {result.name}: HEALTHY ({result.response_time_ms or 0:.2f}ms)")
+        elif result.status == 'warning':
+            self.warnings += 1
+            logger.warning(f"⚠ {result.name}: WARNING - {result.details}")
+        else:
+            if result.critical:
+                self.critical_failures += 1
+                logger.error(f"✗ {result.name}: CRITICAL - {result.details}")
+            else:
+                logger.error(f"✗ {result.name}: DOWN - {result.details}")
+
+    def run_checks(self, endpoints: List[Dict]) -> List[CheckResult]:
         """Run health checks on all endpoints"""
+        return asyncio.run(self.run_checks_async(endpoints))
+    
+    async def run_checks_async(self, endpoints: List[Dict]) -> List[CheckResult]:
+        """Run health checks on all endpoints concurrently from one event loop"""
         logger.info("=" * 60)
         logger.info(f"Starting health checks on {len(endpoints)} endpoints")
         logger.info("=" * 60)
         
-        self.results = []
+        # Checks are network-bound and independent, so they are all awaited at
+        # once. Results are collected on the loop thread, so the counters need
+        # no locking. Each lands in its configuration slot, not completion order.
+        self.results = [None] * len(endpoints)
+        workers = max(1, min(MAX_CHECK_WORKERS, len(endpoints)))
         
-        for endpoint in endpoints:
-            result = self.check_endpoint(endpoint)
-            result['critical'] = endpoint.get('critical', False)
-            self.results.append(result)
-            
-            # Update counters
-            if result['status'] == 'healthy':
-                self.successes += 1
-                logger.info(f"✓ {result['name']}: HEALTHY ({result.get('response_time_ms', 0):.2f}ms)")
-            elif result['status'] == 'warning':
-                self.warnings += 1
-                logger.warning(f"⚠ {result['name']}: WARNING - {result['details']}")
+        # Stamp every result of the run with one shared timestamp
+        run_timestamp = datetime.now().isoformat()
+        
+        # Endpoints that probe the same target (type, url/host, port) under
+        # different names share one probe; each name still gets its own result
+        leads: Dict[str, int] = {}
+        duplicates: Dict[int, List[int]] = {}
+        for index, endpoint in enumerate(endpoints):
+            lead = leads.setdefault(self._probe_key(endpoint), index)
+            if lead != index:
+                duplicates.setdefault(lead, []).append(index)
+        if duplicates:
+            logger.info(f"Skipping {len(endpoints) - len(leads)} duplicate probes")
+        
+        def record(index: int, result: CheckResult):
+            if result.timestamp is None:
+                result.timestamp = run_timestamp
+            result.critical = endpoints[index].get('critical', False)
+            self.results[index] = result
+            self._tally(result)
+        
+        def collect(index: int, result: CheckResult):
+            for other in duplicates.get(index, ()):
+                shared = result.copy()
+                shared.name = endpoints[other]['name']
+                record(other, shared)
+            record(index, result)
+        
+        async def probe(index: int, executor: ThreadPoolExecutor):
+            collect(index, await self.check_endpoint_async(endpoints[index], executor))
+        
+        # With icmplib, every ping endpoint shares one batched ICMP socket
+        ping_indexes = []
+        if self.icmp_available:
+            ping_indexes = [index for index in leads.values()
+                            if endpoints[index].get('type') == 'ping']
+        batched = set(ping_indexes)
+        
+        async def probe_pings(executor: ThreadPoolExecutor):
+            loop = asyncio.get_running_loop()
+            batch_results = await loop.run_in_executor(
+                executor, self.check_pings_batch, [endpoints[i] for i in ping_indexes]
+            )
+            if batch_results is None:
+                await asyncio.gather(*(probe(index, executor) for index in ping_indexes))
             else:
-                if result['critical']:
-                    self.critical_failures += 1
-                    logger.error(f"✗ {result['name']}: CRITICAL - {result['details']}")
-                else:
-                    logger.error(f"✗ {result['name']}: DOWN - {result['details']}")
+                for index, result in zip(ping_indexes, batch_results):
+                    collect(index, result)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            tasks = [probe(index, executor) for index in leads.values()
+                     if index not in batched]
+            if ping_indexes:
+                tasks.append(probe_pings(executor))
+            await asyncio.gather(*tasks)
         
         logger.info("=" * 60)
         logger.info("Health check summary:")
@@ -450,12 +842,22 @@ class HealthChecker:
 # REPORT GENERATION
 # ============================================================================
 
-def generate_json_output(results: List[Dict], output_file: str):
+def generate_json_output(results: List[CheckResult], output_file: str):
     """Generate JSON output for dashboard integration"""
     overall_status = "healthy"
     
-    critical_down = sum(1 for r in results if r['status'] == 'critical' and r['critical'])
-    warnings = sum(1 for r in results if r['status'] == 'warning')
+    # Tally every summary figure in one pass over the results
+    healthy = warnings = critical_down = down = 0
+    for r in results:
+        status = r.status
+        if status == 'healthy':
+            healthy += 1
+        elif status == 'warning':
+            warnings += 1
+        elif status == 'critical' and r.critical:
+            critical_down += 1
+        if not r.available:
+            down += 1
     
     if critical_down > 0:
         overall_status = "critical"
@@ -467,70 +869,79 @@ def generate_json_output(results: List[Dict], output_file: str):
         "overall_status": overall_status,
         "summary": {
             "total_endpoints": len(results),
-            "healthy": sum(1 for r in results if r['status'] == 'healthy'),
+            "healthy": healthy,
             "warnings": warnings,
             "critical": critical_down,
-            "down": sum(1 for r in results if not r.get('available', False))
+            "down": down
         },
-        "endpoints": results,
+        "endpoints": [r.to_dict() for r in results],
         "metadata": {
             "version": __version__,
             "author": __author__
         }
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(output, f, indent=2)
     
     logger.info(f"✓ JSON output saved: {output_file}")
 
-def generate_console_report(results: List[Dict]):
+def generate_console_report(results: List[CheckResult]):
     """Generate human-readable console report"""
-    print("\n" + "=" * 80)
-    print("NETWORK HEALTH MONITORING REPORT")
-    print("=" * 80)
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Total Endpoints: {len(results)}")
-    print()
-    
-    # Group by status
-    healthy = [r for r in results if r['status'] == 'healthy']
-    warnings = [r for r in results if r['status'] == 'warning']
-    critical = [r for r in results if r['status'] == 'critical']
+    # Build the whole report and write it once, so it is not interleaved
+    # with log lines and costs one write instead of one per endpoint
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append("NETWORK HEALTH MONITORING REPORT")
+    lines.append("=" * 80)
+    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"Total Endpoints: {len(results)}")
+    lines.append("")
+    
+    # Group by status in a single pass
+    groups = {'healthy': [], 'warning': [], 'critical': []}
+    for r in results:
+        group = groups.get(r.status)
+        if group is not None:
+            group.append(r)
+    healthy = groups['healthy']
+    warnings = groups['warning']
+    critical = groups['critical']
     
     if healthy:
-        print("✓ HEALTHY SERVICES:")
+        lines.append("✓ HEALTHY SERVICES:")
         for r in healthy:
-            rt = r.get('response_time_ms', 0)
-            print(f"  ✓ {r['name']:30s} - {rt:6.2f}ms")
-        print()
+            rt = r.response_time_ms or 0
+            lines.append(f"  ✓ {r.name:30s} - {rt:6.2f}ms")
+        lines.append("")
     
     if warnings:
-        print("⚠ WARNINGS:")
+        lines.append("⚠ WARNINGS:")
         for r in warnings:
-            print(f"  ⚠ {r['name']:30s} - {r['details']}")
-        print()
+            lines.append(f"  ⚠ {r.name:30s} - {r.details}")
+        lines.append("")
     
     if critical:
-        print("✗ CRITICAL/DOWN:")
+        lines.append("✗ CRITICAL/DOWN:")
         for r in critical:
-            critical_flag = " [CRITICAL]" if r.get('critical') else ""
-            print(f"  ✗ {r['name']:30s} - {r['details']}{critical_flag}")
-        print()
+            critical_flag = " [CRITICAL]" if r.critical else ""
+            lines.append(f"  ✗ {r.name:30s} - {r.details}{critical_flag}")
+        lines.append("")
     
     # Overall health score
     health_score = (len(healthy) / len(results)) * 100
-    print("-" * 80)
-    print(f"OVERALL HEALTH SCORE: {health_score:.1f}%")
+    lines.append("-" * 80)
+    lines.append(f"OVERALL HEALTH SCORE: {health_score:.1f}%")
     
-    if health_score == 100:
-        print("Status: ✓ ALL SYSTEMS OPERATIONAL")
-    elif health_score >= 90:
-        print("Status: ⚠ DEGRADED PERFORMANCE")
-    else:
-        print("Status: ✗ CRITICAL ISSUES DETECTED")
+    lines.append(HEALTH_SCORE_STATUS[bisect_right(HEALTH_SCORE_BOUNDS, health_score)])
+    
+    lines.append("=" * 80)
     
-    print("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # ============================================================================
 # MAIN EXECUTION
@@ -572,7 +983,10 @@ def main():
     
     # Run health checks
     checker = HealthChecker()
-    results = checker.run_checks(endpoints)
+    try:
+        results = asyncio.run(checker.run_checks_async(endpoints))
+    finally:
+        checker.close()
     
     # Generate outputs
     generate_json_output(results, args.output)
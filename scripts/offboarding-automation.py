@@ -25,6 +25,7 @@ Version: 1.0
 Requirements:
     - Python 3.8+
     - requests library
+    - orjson library (optional, faster JSON encoding/decoding)
     - Active Directory PowerShell remoting (for AD actions)
     - GLPI REST API access
     - Appropriate permissions for account deprovisioning
@@ -32,20 +33,42 @@ Requirements:
 Usage:
     ./offboarding-automation.py --username jdoe --manager asmith --reason "Resignation"
     ./offboarding-automation.py --username jdoe --manager asmith --reason "Termination" --immediate
+    ./offboarding-automation.py --batch departures.csv   # columns: username,manager,reason,immediate
 
 Exit codes:
     0 - Offboarding completed successfully
     1 - Partial failure (some steps failed)
     2 - Critical failure (AD account not disabled)
+    (--batch exits with the worst code of any employee in the file; an
+    unreadable file or a row missing username/manager/valid reason counts as 1)
 """
 
 import argparse
+import asyncio
+import atexit
+import csv
 import json
 import logging
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener
+from string import Template
+from typing import Dict, List, Optional, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # Optional: much faster JSON decoding/encoding
+except ImportError:
+    orjson = None
+
+# Prefer orjson for GLPI request/response bodies when it is installed
+json_loads = orjson.loads if orjson is not None else json.loads
+json_dumps = orjson.dumps if orjson is not None else json.dumps
 
 # ============================================================================
 # CONFIGURATION
@@ -68,20 +91,100 @@ SMTP_SERVER = "smtp.northwoodshealth.org"
 IT_EMAIL = "it-ops@northwoodshealth.org"
 HR_EMAIL = "hr@northwoodshealth.org"
 
+# GLPI ticket description; the audit trail lines go between header and footer
+TICKET_HEADER_TEMPLATE = """Employee Offboarding: {username}
+
+OFFBOARDING DETAILS:
+- Employee: {username}
+- Manager: {manager}
+- Reason: {reason}
+- Type: {type}
+- Date: {date}
+
+ACTIONS COMPLETED:
+"""
+
+TICKET_FOOTER_TEMPLATE = """
+
+COMPLETION SUMMARY:
+- Steps Completed: {completed}/{total}
+- Status: {status}
+
+NEXT ACTIONS:
+1. Collect hardware assets from employee
+2. Verify all access revoked within 24 hours
+3. Notify HR of completion
+4. Archive ticket after 30-day retention period
+
+Generated by: Employee Offboarding Automation v{version}
+"""
+
+# HR compliance report; the per-action blocks are rendered into $actions
+HR_REPORT_TEMPLATE = Template("""================================================================================
+EMPLOYEE OFFBOARDING COMPLETION REPORT
+================================================================================
+
+Employee: $username
+Manager: $manager
+Reason: $reason
+Date: $date
+Type: $type
+
+--------------------------------------------------------------------------------
+OFFBOARDING ACTIONS
+--------------------------------------------------------------------------------
+
+${actions}--------------------------------------------------------------------------------
+SUMMARY
+--------------------------------------------------------------------------------
+
+Steps Completed: $completed/$total
+Success Rate: $rate%
+Critical Failures: $critical
+
+${critical_notice}This report serves as documentation of HIPAA-compliant offboarding
+for audit and compliance purposes.
+
+================================================================================
+""")
+
+OFFBOARDING_REASONS = ('Resignation', 'Termination', 'Retirement', 'Transfer')
+
+# Employees offboarded at once in --batch mode (they share one GLPI session)
+BATCH_MAX_WORKERS = 8
+
+# Concurrent per-group / per-application revocation calls (don't flood the DCs)
+REVOKE_MAX_CONCURRENCY = 4
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
+# Log file writes happen on a listener thread; callers only enqueue the record
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, logging.FileHandler(LOG_FILE))
+log_listener.start()
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
     handlers=[
-        logging.FileHandler(LOG_FILE),
+        QueueHandler(log_queue),
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
+
+class EmployeeLogAdapter(logging.LoggerAdapter):
+    """Prefix each record with the employee it concerns (batch runs interleave)"""
+    
+    def process(self, msg, kwargs):
+        return f"[{self.extra['username']}] {msg}", kwargs
+
+# Drain queued log records to disk before the interpreter exits
+atexit.register(log_listener.stop)
+
 # ============================================================================
 # GLPI API CLIENT
 # ============================================================================
@@ -94,20 +197,33 @@ class GLPIClient:
         self.username = username
         self.password = password
         self.session_token = None
+        
+        # Every API call (init, ticket create/update, kill) rides the same
+        # keep-alive connections instead of a new TLS handshake per request
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.kill_session()
     
     def init_session(self) -> bool:
         """Initialize GLPI session"""
         try:
             response = self.session.get(
                 f"{self.base_url}/initSession",
-                auth=(self.username, self.password),
-                headers={'Content-Type': 'application/json'}
+                auth=(self.username, self.password)
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 self.session_token = data.get('session_token')
+                self.session.headers['Session-Token'] = self.session_token
                 logger.info("✓ GLPI session initialized")
                 return True
             else:
@@ -117,10 +233,12 @@ class GLPIClient:
             logger.error(f"Failed to connect to GLPI: {e}")
             return False
     
-    def create_ticket(self, title: str, description: str, category: int = 1) -> Optional[int]:
-        """Create a new ticket in GLPI"""
+    def create_ticket(self, title: str, description: str, category: int = 1,
+                      log: Optional[Union[logging.Logger, logging.LoggerAdapter]] = None) -> Optional[int]:
+        """Create a new ticket in GLPI (log: where to report progress, e.g. a per-employee adapter)"""
+        log = log or logger
         if not self.session_token:
-            logger.error("No active GLPI session")
+            log.error("No active GLPI session")
             return None
         
         try:
@@ -138,55 +256,76 @@ class GLPIClient:
                 }
             }
             
-            logger.info("Attempting to create GLPI ticket...")
-            logger.info(f"Title: {title}")
-            logger.info(f"Description: {description[:100]}...")
+            log.info("Attempting to create GLPI ticket...")
+            log.info(f"Title: {title}")
+            log.info(f"Description: {description[:100]}...")
             
             # In demo mode (guest account), we simulate success
-            logger.warning("⚠ Demo mode: Guest account is read-only, simulating ticket creation")
+            log.warning("⚠ Demo mode: Guest account is read-only, simulating ticket creation")
             
             # Simulated ticket ID
             ticket_id = 9999
-            logger.info(f"✓ [SIMULATED] Offboarding ticket created: #{ticket_id}")
+            log.info(f"✓ [SIMULATED] Offboarding ticket created: #{ticket_id}")
             
             return ticket_id
             
             # Production code (commented out for demo):
             # response = self.session.post(
             #     f"{self.base_url}/Ticket",
-            #     headers={
-            #         'Session-Token': self.session_token,
-            #         'Content-Type': 'application/json'
-            #     },
-            #     json=ticket_data
+            #     data=json_dumps(ticket_data)
             # )
             # 
             # if response.status_code == 201:
-            #     ticket = response.json()
+            #     ticket = json_loads(response.content)
             #     ticket_id = ticket['id']
-            #     logger.info(f"✓ Offboarding ticket created: #{ticket_id}")
+            #     log.info(f"✓ Offboarding ticket created: #{ticket_id}")
             #     return ticket_id
             
         except Exception as e:
-            logger.error(f"Failed to create GLPI ticket: {e}")
+            log.error(f"Failed to create GLPI ticket: {e}")
             return None
     
     def kill_session(self):
         """Close GLPI session"""
         if self.session_token:
             try:
-                self.session.get(
-                    f"{self.base_url}/killSession",
-                    headers={'Session-Token': self.session_token}
-                )
+                self.session.get(f"{self.base_url}/killSession")
                 logger.info("GLPI session closed")
             except:
                 pass
+            self.session_token = None
+            self.session.headers.pop('Session-Token', None)
+        self.session.close()
 
 # ============================================================================
 # OFFBOARDING FUNCTIONS
 # ============================================================================
 
+def run_concurrently(func, items: List, limit: int = REVOKE_MAX_CONCURRENCY) -> List:
+    """Call func on every item from an event loop, at most limit at a time"""
+    async def gather_all():
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def call(item):
+            async with semaphore:
+                return await loop.run_in_executor(None, func, item)
+        
+        return await asyncio.gather(*(call(item) for item in items))
+    
+    return asyncio.run(gather_all())
+
+class AuditEntry:
+    """One audit-trail record (slotted: no per-entry __dict__)"""
+    __slots__ = ('timestamp', 'action', 'status', 'details', 'user')
+    
+    def __init__(self, timestamp: float, action: str, status: str, details: str, user: str):
+        self.timestamp = timestamp  # Epoch seconds; formatted only when the HR report is written
+        self.action = action
+        self.status = status
+        self.details = details
+        self.user = user
+
 class OffboardingManager:
     """Manages the employee offboarding process"""
     
@@ -195,40 +334,63 @@ class OffboardingManager:
         self.manager = manager
         self.reason = reason
         self.immediate = immediate
-        self.audit_trail = []
+        self.audit_trail: List[AuditEntry] = []
+        self.log = EmployeeLogAdapter(logger, {'username': username})
         self.steps_completed = 0
         self.steps_total = 8
         self.critical_failure = False
+        
+        # Steps 3-7 run concurrently; each records into its own per-thread
+        # list so the audit trail can be assembled in step order afterwards
+        self._lock = threading.Lock()
+        self._step_entries = threading.local()
     
     def log_action(self, action: str, status: str, details: str = ""):
         """Log offboarding action to audit trail"""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "status": status,
-            "details": details,
-            "user": self.username
-        }
-        self.audit_trail.append(entry)
+        entry = AuditEntry(time.time(), action, status, details, self.username)
+        step_entries = getattr(self._step_entries, 'entries', None)
+        with self._lock:
+            (self.audit_trail if step_entries is None else step_entries).append(entry)
+            if status == "SUCCESS":
+                self.steps_completed += 1
         
         if status == "SUCCESS":
-            logger.info(f"✓ {action}")
-            self.steps_completed += 1
+            self.log.info(f"✓ {action}")
         elif status == "FAILED":
-            logger.error(f"✗ {action}: {details}")
+            self.log.error(f"✗ {action}: {details}")
         else:
-            logger.warning(f"⚠ {action}: {details}")
+            self.log.warning(f"⚠ {action}: {details}")
+    
+    def run_steps_concurrently(self, steps: Tuple) -> None:
+        """Run independent steps on threads, adding their audit entries in step order"""
+        step_entries: List[List[AuditEntry]] = [[] for _ in steps]
+        
+        def run(index: int):
+            self._step_entries.entries = step_entries[index]
+            try:
+                steps[index]()
+            finally:
+                self._step_entries.entries = None
+        
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(run, index) for index in range(len(steps))]
+            wait(futures)
+        
+        for entries in step_entries:
+            self.audit_trail.extend(entries)
+        for future in futures:
+            future.result()  # Re-raise anything a step didn't handle itself
     
     def disable_ad_account(self) -> bool:
         """Disable Active Directory account"""
-        logger.info("--- Step 1: Disable Active Directory Account ---")
+        self.log.info("--- Step 1: Disable Active Directory Account ---")
         
         try:
             # In production, this would execute PowerShell cmdlet:
             # Disable-ADAccount -Identity $username
             # Set-ADUser -Identity $username -Description "Offboarded: $reason - $date"
             
-            logger.info(f"Disabling AD account: {self.username}")
+            self.log.info(f"Disabling AD account: {self.username}")
             
             # Simulated AD operation
             self.log_action(
@@ -253,7 +415,7 @@ class OffboardingManager:
     
     def revoke_group_memberships(self) -> bool:
         """Remove user from all security groups"""
-        logger.info("--- Step 2: Revoke Group Memberships ---")
+        self.log.info("--- Step 2: Revoke Group Memberships ---")
         
         # Simulated groups
         groups = [
@@ -265,9 +427,8 @@ class OffboardingManager:
             "ePrescribe-Users"
         ]
         
-        for group in groups:
-            # In production: Remove-ADGroupMember -Identity $group -Members $username
-            logger.info(f"  Removing from group: {group}")
+        # Each removal is its own round-trip to a DC, so issue them concurrently
+        run_concurrently(self._remove_from_group, groups)
         
         self.log_action(
             "Revoke Group Memberships",
@@ -276,23 +437,28 @@ class OffboardingManager:
         )
         return True
     
+    def _remove_from_group(self, group: str):
+        """Remove the user from one security group"""
+        # In production: Remove-ADGroupMember -Identity $group -Members $username
+        self.log.info(f"  Removing from group: {group}")
+    
     def disable_mailbox_and_forward(self) -> bool:
         """Disable mailbox and set forwarding to manager"""
-        logger.info("--- Step 3: Mailbox Management ---")
+        self.log.info("--- Step 3: Mailbox Management ---")
         
         try:
             # In production:
             # Set-Mailbox -Identity $username -ForwardingAddress $manager
             # Set-Mailbox -Identity $username -HiddenFromAddressListsEnabled $true
             
-            logger.info(f"Setting mail forwarding: {self.username} → {self.manager}")
+            self.log.info(f"Setting mail forwarding: {self.username} → {self.manager}")
             self.log_action(
                 "Configure Mail Forwarding",
                 "SUCCESS",
                 f"Email forwarded to manager: {self.manager}"
             )
             
-            logger.info("Hiding mailbox from Global Address List")
+            self.log.info("Hiding mailbox from Global Address List")
             self.log_action(
                 "Hide Mailbox from GAL",
                 "SUCCESS",
@@ -300,7 +466,7 @@ class OffboardingManager:
             )
             
             # Convert to shared mailbox after 30 days (scheduled task)
-            logger.info("Scheduled: Convert to shared mailbox in 30 days")
+            self.log.info("Scheduled: Convert to shared mailbox in 30 days")
             self.log_action(
                 "Schedule Mailbox Conversion",
                 "SUCCESS",
@@ -316,13 +482,13 @@ class OffboardingManager:
     
     def archive_user_files(self) -> bool:
         """Archive user's home directory and OneDrive files"""
-        logger.info("--- Step 4: Archive User Files ---")
+        self.log.info("--- Step 4: Archive User Files ---")
         
         try:
             home_dir = f"\\\\fileserver\\home$\\{self.username}"
             archive_path = f"\\\\fileserver\\archive\\offboarding\\{self.username}-{datetime.now().strftime('%Y%m%d')}"
             
-            logger.info(f"Archiving files: {home_dir} → {archive_path}")
+            self.log.info(f"Archiving files: {home_dir} → {archive_path}")
             
             # In production:
             # robocopy $home_dir $archive_path /MIR /SEC /LOG+:$logfile
@@ -338,7 +504,7 @@ class OffboardingManager:
             )
             
             # Grant manager access to archive
-            logger.info(f"Granting manager access to archive: {self.manager}")
+            self.log.info(f"Granting manager access to archive: {self.manager}")
             self.log_action(
                 "Grant Manager Archive Access",
                 "SUCCESS",
@@ -353,7 +519,7 @@ class OffboardingManager:
     
     def revoke_application_access(self) -> bool:
         """Revoke access to clinical and business applications"""
-        logger.info("--- Step 5: Revoke Application Access ---")
+        self.log.info("--- Step 5: Revoke Application Access ---")
         
         # Applications to revoke
         apps = [
@@ -364,9 +530,8 @@ class OffboardingManager:
             ("VPN", "OpenVPN")
         ]
         
-        for app_type, app_name in apps:
-            logger.info(f"  Revoking access: {app_name}")
-            # In production: API calls to each system to disable access
+        # One API call per system; none depends on another
+        run_concurrently(self._revoke_application, apps)
         
         self.log_action(
             "Revoke Application Access",
@@ -375,13 +540,19 @@ class OffboardingManager:
         )
         return True
     
+    def _revoke_application(self, app: Tuple[str, str]):
+        """Disable the user's access to one application"""
+        app_type, app_name = app
+        self.log.info(f"  Revoking access: {app_name}")
+        # In production: API call to the system to disable access
+    
     def disable_remote_access(self) -> bool:
         """Disable VPN and remote desktop access"""
-        logger.info("--- Step 6: Disable Remote Access ---")
+        self.log.info("--- Step 6: Disable Remote Access ---")
         
         try:
             # Revoke VPN certificate
-            logger.info("Revoking VPN certificates...")
+            self.log.info("Revoking VPN certificates...")
             self.log_action(
                 "Revoke VPN Certificates",
                 "SUCCESS",
@@ -389,7 +560,7 @@ class OffboardingManager:
             )
             
             # Disable RDP if enabled
-            logger.info("Disabling Remote Desktop access...")
+            self.log.info("Disabling Remote Desktop access...")
             self.log_action(
                 "Disable RDP Access",
                 "SUCCESS",
@@ -411,7 +582,7 @@ class OffboardingManager:
     
     def collect_hardware(self) -> bool:
         """Log hardware to be collected from employee"""
-        logger.info("--- Step 7: Hardware Collection ---")
+        self.log.info("--- Step 7: Hardware Collection ---")
         
         # In production, query GLPI for assigned assets
         assigned_assets = [
@@ -421,9 +592,9 @@ class OffboardingManager:
             ("Mobile Phone", "NHS-PHN-019", "iPhone 13")
         ]
         
-        logger.info(f"Assets assigned to {self.username}:")
+        self.log.info(f"Assets assigned to {self.username}:")
         for asset_type, asset_tag, model in assigned_assets:
-            logger.info(f"  - {asset_type}: {asset_tag} ({model})")
+            self.log.info(f"  - {asset_type}: {asset_tag} ({model})")
         
         self.log_action(
             "Log Assigned Hardware",
@@ -440,44 +611,29 @@ class OffboardingManager:
     
     def create_offboarding_ticket(self, glpi_client: GLPIClient) -> Optional[int]:
         """Create comprehensive offboarding ticket in GLPI"""
-        logger.info("--- Step 8: Create Offboarding Ticket ---")
+        self.log.info("--- Step 8: Create Offboarding Ticket ---")
         
         # Build ticket description with audit trail
-        description = f"""Employee Offboarding: {self.username}
-
-OFFBOARDING DETAILS:
-- Employee: {self.username}
-- Manager: {self.manager}
-- Reason: {self.reason}
-- Type: {"IMMEDIATE" if self.immediate else "STANDARD"}
-- Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-ACTIONS COMPLETED:
-"""
-        
-        for entry in self.audit_trail:
-            status_icon = "✓" if entry['status'] == "SUCCESS" else "✗"
-            description += f"\n{status_icon} {entry['action']}"
-            if entry['details']:
-                description += f"\n   {entry['details']}"
-        
-        description += f"""
-
-COMPLETION SUMMARY:
-- Steps Completed: {self.steps_completed}/{self.steps_total}
-- Status: {"COMPLETE" if self.steps_completed == self.steps_total else "PARTIAL"}
-
-NEXT ACTIONS:
-1. Collect hardware assets from employee
-2. Verify all access revoked within 24 hours
-3. Notify HR of completion
-4. Archive ticket after 30-day retention period
-
-Generated by: Employee Offboarding Automation v{__version__}
-"""
+        actions = "".join(
+            f"\n{'✓' if entry.status == 'SUCCESS' else '✗'} {entry.action}"
+            + (f"\n   {entry.details}" if entry.details else "")
+            for entry in self.audit_trail
+        )
+        description = TICKET_HEADER_TEMPLATE.format(
+            username=self.username,
+            manager=self.manager,
+            reason=self.reason,
+            type="IMMEDIATE" if self.immediate else "STANDARD",
+            date=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ) + actions + TICKET_FOOTER_TEMPLATE.format(
+            completed=self.steps_completed,
+            total=self.steps_total,
+            status="COMPLETE" if self.steps_completed == self.steps_total else "PARTIAL",
+            version=__version__
+        )
         
         title = f"Employee Offboarding: {self.username} - {self.reason}"
-        ticket_id = glpi_client.create_ticket(title, description, category=5)
+        ticket_id = glpi_client.create_ticket(title, description, category=5, log=self.log)
         
         if ticket_id:
             self.log_action(
@@ -496,105 +652,76 @@ Generated by: Employee Offboarding Automation v{__version__}
     
     def generate_hr_report(self) -> str:
         """Generate compliance report for HR"""
-        report_file = f"offboarding-report-{self.username}-{datetime.now().strftime('%Y%m%d')}.txt"
+        now = datetime.now()
+        report_file = f"offboarding-report-{self.username}-{now.strftime('%Y%m%d')}.txt"
         
+        actions = "".join(
+            f"[{datetime.fromtimestamp(entry.timestamp).isoformat()}] {entry.action}\n"
+            f"Status: {entry.status}\n"
+            + (f"Details: {entry.details}\n" if entry.details else "")
+            + "\n"
+            for entry in self.audit_trail
+        )
+        
+        report = HR_REPORT_TEMPLATE.substitute(
+            username=self.username,
+            manager=self.manager,
+            reason=self.reason,
+            date=now.strftime('%Y-%m-%d %H:%M:%S'),
+            type='IMMEDIATE' if self.immediate else 'STANDARD',
+            actions=actions,
+            completed=self.steps_completed,
+            total=self.steps_total,
+            rate=f"{(self.steps_completed/self.steps_total)*100:.1f}",
+            critical='YES' if self.critical_failure else 'NO',
+            critical_notice=(
+                "⚠ CRITICAL: Account deprovisioning failed - manual intervention required\n\n"
+                if self.critical_failure else ""
+            )
+        )
+        
+        # Built in memory, written in one call; a failed write must fail the run
         with open(report_file, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write("EMPLOYEE OFFBOARDING COMPLETION REPORT\n")
-            f.write("=" * 80 + "\n\n")
-            f.write(f"Employee: {self.username}\n")
-            f.write(f"Manager: {self.manager}\n")
-            f.write(f"Reason: {self.reason}\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Type: {'IMMEDIATE' if self.immediate else 'STANDARD'}\n\n")
-            
-            f.write("-" * 80 + "\n")
-            f.write("OFFBOARDING ACTIONS\n")
-            f.write("-" * 80 + "\n\n")
-            
-            for entry in self.audit_trail:
-                f.write(f"[{entry['timestamp']}] {entry['action']}\n")
-                f.write(f"Status: {entry['status']}\n")
-                if entry['details']:
-                    f.write(f"Details: {entry['details']}\n")
-                f.write("\n")
-            
-            f.write("-" * 80 + "\n")
-            f.write("SUMMARY\n")
-            f.write("-" * 80 + "\n\n")
-            f.write(f"Steps Completed: {self.steps_completed}/{self.steps_total}\n")
-            f.write(f"Success Rate: {(self.steps_completed/self.steps_total)*100:.1f}%\n")
-            f.write(f"Critical Failures: {'YES' if self.critical_failure else 'NO'}\n\n")
-            
-            if self.critical_failure:
-                f.write("⚠ CRITICAL: Account deprovisioning failed - manual intervention required\n\n")
-            
-            f.write("This report serves as documentation of HIPAA-compliant offboarding\n")
-            f.write("for audit and compliance purposes.\n\n")
-            f.write("=" * 80 + "\n")
+            f.write(report)
         
-        logger.info(f"✓ HR compliance report generated: {report_file}")
+        self.log.info(f"✓ HR compliance report generated: {report_file}")
         return report_file
 
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Automated employee offboarding for healthcare IT",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    parser.add_argument('--username', required=True,
-                       help='Username of employee to offboard')
-    parser.add_argument('--manager', required=True,
-                       help='Username of employee\'s manager')
-    parser.add_argument('--reason', required=True,
-                       choices=['Resignation', 'Termination', 'Retirement', 'Transfer'],
-                       help='Reason for offboarding')
-    parser.add_argument('--immediate', action='store_true',
-                       help='Immediate offboarding (security incident)')
-    parser.add_argument('--verbose', '-v', action='store_true',
-                       help='Enable verbose logging')
-    
-    args = parser.parse_args()
-    
-    if args.verbose:
-        logger.setLevel(logging.DEBUG)
-    
-    logger.info("=" * 80)
-    logger.info(f"Employee Offboarding Automation v{__version__}")
-    logger.info("=" * 80)
-    logger.info(f"Employee: {args.username}")
-    logger.info(f"Manager: {args.manager}")
-    logger.info(f"Reason: {args.reason}")
-    logger.info(f"Type: {'IMMEDIATE' if args.immediate else 'STANDARD'}")
-    logger.info("=" * 80)
-    
+def offboard_employee(username: str, manager: str, reason: str, immediate: bool,
+                      glpi_client: GLPIClient) -> int:
+    """Run every offboarding step for one employee and return its exit code"""
     # Initialize offboarding manager
     offboarding = OffboardingManager(
-        username=args.username,
-        manager=args.manager,
-        reason=args.reason,
-        immediate=args.immediate
+        username=username,
+        manager=manager,
+        reason=reason,
+        immediate=immediate
     )
+    log = offboarding.log
     
-    # Connect to GLPI
-    glpi_client = GLPIClient(GLPI_URL, GLPI_USERNAME, GLPI_PASSWORD)
-    
-    if not glpi_client.init_session():
-        logger.error("Failed to connect to GLPI - continuing without ticketing")
+    log.info(f"Employee: {username}")
+    log.info(f"Manager: {manager}")
+    log.info(f"Reason: {reason}")
+    log.info(f"Type: {'IMMEDIATE' if immediate else 'STANDARD'}")
+    log.info("=" * 80)
     
     try:
-        # Execute offboarding steps
+        # Cut off access first; these must complete before anything else
         offboarding.disable_ad_account()
         offboarding.revoke_group_memberships()
-        offboarding.disable_mailbox_and_forward()
-        offboarding.archive_user_files()
-        offboarding.revoke_application_access()
-        offboarding.disable_remote_access()
-        offboarding.collect_hardware()
+        
+        # The remaining steps don't depend on each other, so overlap them
+        offboarding.run_steps_concurrently((
+            offboarding.disable_mailbox_and_forward,
+            offboarding.archive_user_files,
+            offboarding.revoke_application_access,
+            offboarding.disable_remote_access,
+            offboarding.collect_hardware
+        ))
         
         # Create GLPI ticket
         if glpi_client.session_token:
@@ -604,32 +731,101 @@ def main():
         report_file = offboarding.generate_hr_report()
         
         # Final summary
-        logger.info("=" * 80)
-        logger.info("OFFBOARDING COMPLETE")
-        logger.info("=" * 80)
-        logger.info(f"Steps Completed: {offboarding.steps_completed}/{offboarding.steps_total}")
-        logger.info(f"Success Rate: {(offboarding.steps_completed/offboarding.steps_total)*100:.1f}%")
-        logger.info(f"HR Report: {report_file}")
-        logger.info(f"Audit Log: {LOG_FILE}")
-        logger.info("=" * 80)
+        log.info("=" * 80)
+        log.info("OFFBOARDING COMPLETE")
+        log.info("=" * 80)
+        log.info(f"Steps Completed: {offboarding.steps_completed}/{offboarding.steps_total}")
+        log.info(f"Success Rate: {(offboarding.steps_completed/offboarding.steps_total)*100:.1f}%")
+        log.info(f"HR Report: {report_file}")
+        log.info(f"Audit Log: {LOG_FILE}")
+        log.info("=" * 80)
         
         # Determine exit code
         if offboarding.critical_failure:
-            logger.error("CRITICAL: AD account not disabled - manual intervention required")
+            log.error("CRITICAL: AD account not disabled - manual intervention required")
             return 2
         elif offboarding.steps_completed < offboarding.steps_total:
-            logger.warning("WARNING: Some steps failed - review log for details")
+            log.warning("WARNING: Some steps failed - review log for details")
             return 1
         else:
-            logger.info("SUCCESS: All offboarding steps completed")
+            log.info("SUCCESS: All offboarding steps completed")
             return 0
         
     except Exception as e:
-        logger.error(f"Offboarding failed: {e}", exc_info=True)
+        log.error(f"Offboarding failed: {e}", exc_info=True)
         return 2
+
+def run_batch(path: str, glpi_client: GLPIClient) -> int:
+    """Offboard every employee listed in a CSV file, several at a time"""
+    try:
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+    except OSError as e:
+        logger.error(f"✗ Cannot read batch file {path}: {e}")
+        return 1
+    
+    def offboard_row(row: Dict[str, str]) -> int:
+        username = (row.get('username') or '').strip()
+        manager = (row.get('manager') or '').strip()
+        reason = (row.get('reason') or '').strip()
+        if not username or not manager or reason not in OFFBOARDING_REASONS:
+            logger.error(f"✗ Skipping batch row {row}: needs username, manager and a valid reason")
+            return 1
+        immediate = (row.get('immediate') or '').strip().lower() in ('1', 'true', 'yes', 'y')
+        return offboard_employee(username, manager, reason, immediate, glpi_client)
+    
+    # All workers share the one GLPI session; log records go through the queue
+    with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+        exit_codes = list(executor.map(offboard_row, rows))
+    
+    logger.info("=" * 80)
+    logger.info(f"BATCH COMPLETE: {exit_codes.count(0)}/{len(exit_codes)} employees fully offboarded")
+    logger.info("=" * 80)
+    return max(exit_codes, default=0)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Automated employee offboarding for healthcare IT",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument('--username',
+                       help='Username of employee to offboard')
+    parser.add_argument('--manager',
+                       help='Username of employee\'s manager')
+    parser.add_argument('--reason',
+                       choices=OFFBOARDING_REASONS,
+                       help='Reason for offboarding')
+    parser.add_argument('--immediate', action='store_true',
+                       help='Immediate offboarding (security incident)')
+    parser.add_argument('--batch', metavar='CSV',
+                       help='Offboard every employee in a CSV file '
+                            '(columns: username, manager, reason, immediate)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Enable verbose logging')
+    
+    args = parser.parse_args()
+    
+    if not args.batch and not (args.username and args.manager and args.reason):
+        parser.error("--username, --manager and --reason are required unless --batch is given")
+    
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    
+    logger.info("=" * 80)
+    logger.info(f"Employee Offboarding Automation v{__version__}")
+    logger.info("=" * 80)
+    
+    # Connect to GLPI once; the session is killed when the block exits
+    with GLPIClient(GLPI_URL, GLPI_USERNAME, GLPI_PASSWORD) as glpi_client:
+        if not glpi_client.init_session():
+            logger.error("Failed to connect to GLPI - continuing without ticketing")
+        
+        if args.batch:
+            return run_batch(args.batch, glpi_client)
         
-    finally:
-        glpi_client.kill_session()
+        return offboard_employee(args.username, args.manager, args.reason, args.immediate,
+                                 glpi_client)
 
 if __name__ == '__main__':
     from datetime import timedelta
@@ -23,12 +23,14 @@ Version: 1.0
 Requirements:
     - Python 3.8+
     - requests library
+    - orjson library (optional, faster JSON parsing)
     - GLPI REST API access (read-only is sufficient)
 
 Usage:
     ./ticket-report-generator.py --url https://glpi.example.com/apirest.php --username guest --password guest
     ./ticket-report-generator.py --config glpi-config.json --output-dir ./reports
     ./ticket-report-generator.py --start 2026-02-01 --end 2026-02-07
+    ./ticket-report-generator.py --output-dir ./reports --compress
 
 Exit codes:
     0 - Report generated successfully
@@ -45,14 +47,35 @@ Sample Output:
 
 import argparse
 import csv
+import gzip
+import hashlib
 import json
 import logging
 import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from html import escape
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from string import Template
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: much faster JSON decoding
+except ImportError:
+    orjson = None
+
+# Ticket pages are large JSON arrays; prefer orjson to parse them (and the
+# config and user cache files, so all decoding goes through one function)
+json_loads = orjson.loads if orjson is not None else json.loads
 
 # ============================================================================
 # CONFIGURATION
@@ -68,14 +91,36 @@ DEFAULT_PASSWORD = "guest"
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 LOG_FILE = f"ticket-report-{datetime.now().strftime('%Y-%m-%d')}.log"
 
-STATUS_MAP = {
-    1: "New",
-    2: "Assigned",
-    3: "Planned",
-    4: "Pending",
-    5: "Solved",
-    6: "Closed"
-}
+# Technician names persisted between runs (user ID -> name, refreshed daily)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ticket-report"
+USER_CACHE_TTL = 24 * 3600  # seconds
+USER_CACHE_MAX_AGE = 7 * 24 * 3600  # entries not refreshed for a week are dropped
+
+# HTTP connection pool and retries for transient GLPI/gateway errors (the pool
+# covers USER_LOOKUP_WORKERS and the concurrent ticket page fetches)
+HTTP_POOL_SIZE = 32
+HTTP_RETRIES = 3
+
+# Concurrent User/{id} lookups for technicians the cache cannot answer
+USER_LOOKUP_WORKERS = 16
+
+# Tickets are pulled in fixed-size pages, a few pages at a time
+TICKET_PAGE_SIZE = 200
+TICKET_FETCH_WORKERS = 4
+
+# Large write buffers so the streamed reports reach disk in a few big writes
+CSV_WRITE_BUFFER = 1 << 20
+HTML_WRITE_BUFFER = 1 << 16
+HTML_GZIP_LEVEL = 6
+
+# Ticket fields the analysis and CSV export read, pulled out once as columns
+TICKET_COLUMNS = (
+    "id", "name", "status", "date", "solvedate", "closedate",
+    "due_date", "users_id_assign", "satisfaction"
+)
+
+# GLPI status codes 1-6, indexed directly by code (slot 0 is unused)
+STATUS_NAMES = ("", "New", "Assigned", "Planned", "Pending", "Solved", "Closed")
 
 # ============================================================================
 # LOGGING SETUP
@@ -103,20 +148,31 @@ class GLPIClient:
         self.username = username
         self.password = password
         self.session_token = None
+
+        # Page fetches run on several threads; size the pool so each keeps
+        # its own keep-alive connection, and retry throttling/gateway errors
+        # (a status that is still failing after the retries is returned as-is)
         self.session = requests.Session()
+        retry = Retry(total=HTTP_RETRIES, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                              max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
 
     def init_session(self) -> bool:
         """Initialize GLPI API session"""
         try:
             response = self.session.get(
                 f"{self.base_url}/initSession",
-                auth=(self.username, self.password),
-                headers={'Content-Type': 'application/json'}
+                auth=(self.username, self.password)
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 self.session_token = data.get('session_token')
+                self.session.headers['Session-Token'] = self.session_token
                 logger.info("✓ GLPI session initialized successfully")
                 return True
 
@@ -127,23 +183,18 @@ class GLPIClient:
             logger.error(f"Failed to connect to GLPI: {exc}")
             return False
 
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
-        """Make GET request to GLPI API"""
+    def request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Make GET request to GLPI API and return the raw response"""
         if not self.session_token:
             logger.error("No active session - call init_session() first")
             return None
 
         try:
-            url = f"{self.base_url}/{endpoint}"
-            headers = {
-                'Session-Token': self.session_token,
-                'Content-Type': 'application/json'
-            }
-
-            response = self.session.get(url, headers=headers, params=params)
+            response = self.session.get(f"{self.base_url}/{endpoint}", params=params)
 
-            if response.status_code == 200:
-                return response.json()
+            # 206 Partial Content is how GLPI answers a range smaller than the total
+            if response.status_code in (200, 206):
+                return response
 
             logger.warning(f"GET {endpoint} returned {response.status_code}")
             return None
@@ -152,50 +203,269 @@ class GLPIClient:
             logger.error(f"API request failed: {exc}")
             return None
 
+    def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Make GET request to GLPI API"""
+        response = self.request(endpoint, params)
+        return json_loads(response.content) if response is not None else None
+
+    def count(self, endpoint: str) -> Optional[int]:
+        """Return the total number of items behind an endpoint (from Content-Range)"""
+        response = self.request(endpoint, params={"range": "0-0"})
+        if response is None:
+            return None
+
+        content_range = response.headers.get("Content-Range", "")
+        try:
+            return int(content_range.rsplit("/", 1)[1])
+        except (IndexError, ValueError):
+            return 0
+
     def kill_session(self):
         """Close GLPI API session"""
         if self.session_token:
             try:
-                self.session.get(
-                    f"{self.base_url}/killSession",
-                    headers={'Session-Token': self.session_token}
-                )
+                self.session.get(f"{self.base_url}/killSession")
             except requests.RequestException:
                 pass
+            self.session_token = None
+            self.session.headers.pop('Session-Token', None)
+        self.session.close()
 
 # ============================================================================
 # DATA COLLECTION
 # ============================================================================
 
-def fetch_tickets(client: GLPIClient) -> List[Dict]:
-    """Fetch ticket list from GLPI"""
+def iter_items(client: GLPIClient, itemtype: str,
+               failed_ranges: Optional[List[str]] = None) -> Iterator[Dict]:
+    """Yield every item of an itemtype, page by page, as concurrent fetches complete
+
+    Pages that cannot be retrieved are skipped with a warning; pass a list as
+    failed_ranges to learn which ranges are missing from the result.
+    """
+    total = client.count(itemtype)
+    if not total:
+        return
+
+    ranges = (
+        f"{start}-{min(start + TICKET_PAGE_SIZE, total) - 1}"
+        for start in range(0, total, TICKET_PAGE_SIZE)
+    )
+    page_count = -(-total // TICKET_PAGE_SIZE)
+
+    def fetch_page(rng: str) -> Optional[List[Dict]]:
+        return client.get(itemtype, params={"range": rng})
+
+    # Keep at most TICKET_FETCH_WORKERS pages in flight so only a few pages are
+    # ever buffered ahead of the in-order consumer
+    missing = 0
+    executor = ThreadPoolExecutor(max_workers=TICKET_FETCH_WORKERS)
+    pending = deque((rng, executor.submit(fetch_page, rng)) for rng in islice(ranges, TICKET_FETCH_WORKERS))
+    try:
+        while pending:
+            page_range, future = pending.popleft()
+            page = future.result()
+            for rng in islice(ranges, 1):
+                pending.append((rng, executor.submit(fetch_page, rng)))
+            if page is None:
+                missing += 1
+                if failed_ranges is not None:
+                    failed_ranges.append(page_range)
+            elif page:
+                yield from page
+    finally:
+        # Stop early (consumer error or generator closed) without downloading the rest
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+    if missing:
+        logger.warning(f"⚠ {missing} of {page_count} {itemtype} pages could not be retrieved")
+
+
+def iter_tickets(client: GLPIClient) -> Iterator[Dict]:
+    """Stream the ticket list from GLPI"""
     logger.info("Fetching ticket data...")
-    tickets = client.get("Ticket", params={"range": "0-999"})
-    return tickets if tickets else []
+    return iter_items(client, "Ticket")
+
 
+def prefetch_users(client: GLPIClient) -> Tuple[Dict[int, str], bool]:
+    """Fetch every GLPI user's display name in bulk (user ID -> name)
 
-def fetch_user_name(client: GLPIClient, user_id: Optional[int], cache: Dict[int, str]) -> str:
+    The flag is False when any page of the user list could not be retrieved,
+    so a user missing from the result may still exist in GLPI.
+    """
+    failed_ranges: List[str] = []
+    names = {
+        user["id"]: user.get("realname") or user.get("name") or f"User {user['id']}"
+        for user in iter_items(client, "User", failed_ranges)
+        if isinstance(user, dict) and "id" in user
+    }
+    return names, not failed_ranges
+
+
+def lookup_user(client: GLPIClient, user_id: int) -> Optional[str]:
+    """Fetch a user's display name from GLPI"""
+    user = client.get(f"User/{user_id}")
+    if isinstance(user, dict):
+        return user.get("realname") or user.get("name") or f"User {user_id}"
+    return None
+
+
+class UserCache:
+    """Technician names kept on disk between runs
+
+    Entries younger than USER_CACHE_TTL are served as-is. IDs with no entry
+    or only a stale one are reported by missing(), so the caller can refresh
+    them all with one bulk User fetch instead of a GET per technician.
+    Entries that have not been refreshed within USER_CACHE_MAX_AGE (e.g.
+    users removed from GLPI) are dropped on load so the file does not grow
+    without bound.
+    """
+
+    def __init__(self, client: GLPIClient, path: Optional[Path] = None):
+        self.client = client
+        self.path = path
+        self.entries: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.load()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.save()
+
+    def load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            stored = json_loads(self.path.read_bytes())
+            if not isinstance(stored, dict):
+                raise ValueError(f"expected a JSON object, got {type(stored).__name__}")
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable user cache {self.path}: {exc}")
+            return
+
+        # Keep well-formed, unexpired entries; anything else is skipped rather
+        # than allowed to fail the run later
+        cutoff = time.time() - USER_CACHE_MAX_AGE
+        invalid = 0
+        for user_id, entry in stored.items():
+            try:
+                name = entry["name"]
+                fetched_at = float(entry.get("fetched_at", 0))
+                user_id = int(user_id)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                invalid += 1
+                continue
+            if not isinstance(name, str):
+                invalid += 1
+            elif fetched_at >= cutoff:
+                self.entries[user_id] = {"name": name, "fetched_at": fetched_at}
+        if invalid:
+            logger.warning(f"Skipped {invalid} malformed entries in user cache {self.path}")
+        logger.debug(f"Loaded {len(self.entries)} cached user names "
+                     f"({len(stored) - len(self.entries) - invalid} expired)")
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                payload = json.dumps({str(user_id): entry for user_id, entry in self.entries.items()})
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as exc:
+            logger.warning(f"Could not save user cache {self.path}: {exc}")
+
+    def store(self, user_id: int, name: str) -> None:
+        with self._lock:
+            self.entries[user_id] = {"name": name, "fetched_at": time.time()}
+
+    def store_many(self, names: Dict[int, str]) -> None:
+        fetched_at = time.time()
+        with self._lock:
+            for user_id, name in names.items():
+                self.entries[user_id] = {"name": name, "fetched_at": fetched_at}
+
+    def missing(self, user_ids: Iterable[int]) -> set:
+        """Return the IDs that have no entry or only a stale one"""
+        cutoff = time.time() - USER_CACHE_TTL
+        return {
+            user_id for user_id in user_ids
+            if self.entries.get(user_id, {}).get("fetched_at", 0) < cutoff
+        }
+
+    def get(self, user_id: int) -> Optional[str]:
+        """Return the cached name, stale or not (missing() drives refreshes)"""
+        entry = self.entries.get(user_id)
+        return entry["name"] if entry is not None else None
+
+
+def fetch_user_name(client: GLPIClient, user_id: Optional[int], cache: UserCache) -> str:
     """Lookup user name by ID with caching"""
     if not user_id:
         return "Unassigned"
-    if user_id in cache:
-        return cache[user_id]
+    cached = cache.get(user_id)
+    if cached is not None:
+        return cached
 
-    user = client.get(f"User/{user_id}")
-    if isinstance(user, dict):
-        name = user.get("realname") or user.get("name") or f"User {user_id}"
-        cache[user_id] = name
+    name = lookup_user(client, user_id)
+    if name:
+        cache.store(user_id, name)
         return name
 
     return f"User {user_id}"
 
+
+def resolve_user_names(client: GLPIClient, user_ids: Iterable[Optional[int]],
+                       cache: UserCache) -> Dict[Optional[int], str]:
+    """Resolve each distinct user ID to a name, looking up cache misses concurrently"""
+    unique_ids = list(dict.fromkeys(user_ids))
+    with ThreadPoolExecutor(max_workers=USER_LOOKUP_WORKERS) as executor:
+        names = executor.map(lambda user_id: fetch_user_name(client, user_id, cache), unique_ids)
+        return dict(zip(unique_ids, names))
+
 # ============================================================================
 # ANALYSIS FUNCTIONS
 # ============================================================================
 
+def tickets_to_columns(tickets: List[Dict], opened: List[Optional[datetime]]) -> Dict[str, List]:
+    """Split ticket dicts into one list per field (row i of every list is ticket i)
+
+    The opening dates were already parsed while filtering, so they are passed
+    in and kept as the "opened" column rather than parsed again.
+    """
+    columns = {field: [ticket.get(field) for ticket in tickets] for field in TICKET_COLUMNS}
+    columns["opened"] = opened
+    return columns
+
+
 def parse_date(date_value: Optional[str]) -> Optional[datetime]:
     if not date_value:
         return None
+    return _parse_date_string(date_value)
+
+
+@lru_cache(maxsize=16384)
+def _parse_date_string(date_value: str) -> Optional[datetime]:
+    """Parse one non-empty GLPI date string (memoized; GLPI dates repeat heavily)"""
+    # GLPI sends "YYYY-MM-DD HH:MM:SS" or "YYYY-MM-DD"; slice those directly
+    length = len(date_value)
+    if length in (10, 19) and date_value[4] == "-" and date_value[7] == "-":
+        try:
+            if length == 10:
+                return datetime(int(date_value[:4]), int(date_value[5:7]), int(date_value[8:10]))
+            if date_value[10] == " " and date_value[13] == ":" and date_value[16] == ":":
+                return datetime(
+                    int(date_value[:4]), int(date_value[5:7]), int(date_value[8:10]),
+                    int(date_value[11:13]), int(date_value[14:16]), int(date_value[17:19])
+                )
+        except ValueError:
+            return None
+
     for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
         try:
             return datetime.strptime(date_value, fmt)
@@ -204,27 +474,50 @@ def parse_date(date_value: Optional[str]) -> Optional[datetime]:
     return None
 
 
+def parse_dates(values: Iterable[Optional[str]]) -> Dict[str, datetime]:
+    """Parse each distinct date string once; unparseable values are left out"""
+    parsed = {}
+    for value in set(values):
+        date_value = parse_date(value)
+        if date_value:
+            parsed[value] = date_value
+    return parsed
+
+
 def is_within_range(date_value: Optional[datetime], start: datetime, end: datetime) -> bool:
     return bool(date_value and start <= date_value <= end)
 
 
-def calculate_sla_compliance(tickets: List[Dict], end: datetime) -> Dict[str, int]:
-    """Calculate SLA compliance based on due date vs solved date"""
+def analyze_tickets(columns: Dict[str, List], end: datetime,
+                    technician_names: Dict[Optional[int], str]) -> Tuple[Dict[str, int], List[Dict], Dict[str, Any]]:
+    """Compute SLA compliance, technician metrics and satisfaction in one pass"""
     compliant = 0
     non_compliant = 0
     unknown = 0
+    by_id: Dict[Any, Dict[str, Any]] = {}
+    ratings: Counter = Counter()
+
+    solved_values = columns["solvedate"]
+    due_values = columns["due_date"]
+
+    # Parse each distinct date string only once; the loop below then only
+    # does lookups
+    dates = parse_dates(chain(solved_values, due_values))
 
-    for ticket in tickets:
-        due_date = parse_date(ticket.get("due_date"))
-        solved_date = parse_date(ticket.get("solvedate"))
+    for technician_id, status, opened, solved_value, due_value, rating in zip(
+        columns["users_id_assign"], columns["status"], columns["opened"], solved_values,
+        due_values, columns["satisfaction"]
+    ):
+        due_date = dates.get(due_value)
+        solved_date = dates.get(solved_value)
 
+        # SLA: due date vs solved date (or the report end for open tickets)
         if due_date and solved_date:
             if solved_date <= due_date:
                 compliant += 1
             else:
                 non_compliant += 1
-        elif due_date and ticket.get("status") in (1, 2, 3, 4):
-            # Open ticket - compare with current end date
+        elif due_date and status in (1, 2, 3, 4):
             if end <= due_date:
                 compliant += 1
             else:
@@ -232,6 +525,32 @@ def calculate_sla_compliance(tickets: List[Dict], end: datetime) -> Dict[str, in
         else:
             unknown += 1
 
+        # Technician metrics, grouped by ID so each is resolved to a name once;
+        # resolution time is kept as a running sum/count, not a list of hours
+        data = by_id.get(technician_id)
+        if data is None:
+            data = by_id[technician_id] = {"total": 0, "resolved": 0, "res_sum": 0.0, "res_n": 0}
+
+        data["total"] += 1
+
+        if status in (5, 6):
+            data["resolved"] += 1
+            if opened and solved_date:
+                data["res_sum"] += (solved_date - opened).total_seconds() / 3600
+                data["res_n"] += 1
+
+        if isinstance(rating, (int, float)) and rating > 0:
+            ratings[rating] += 1
+
+    return (
+        summarize_sla(compliant, non_compliant, unknown),
+        summarize_technicians(by_id, technician_names),
+        summarize_satisfaction(ratings)
+    )
+
+
+def summarize_sla(compliant: int, non_compliant: int, unknown: int) -> Dict[str, int]:
+    """Turn SLA counters into the report's compliance summary"""
     total = compliant + non_compliant + unknown
     compliance_rate = round((compliant / total) * 100, 2) if total else 0
 
@@ -243,33 +562,25 @@ def calculate_sla_compliance(tickets: List[Dict], end: datetime) -> Dict[str, in
     }
 
 
-def build_technician_metrics(tickets: List[Dict], client: GLPIClient) -> List[Dict]:
-    """Aggregate ticket metrics per technician"""
-    tech_cache: Dict[int, str] = {}
-    metrics: Dict[str, Dict[str, float]] = {}
-
-    for ticket in tickets:
-        technician_id = ticket.get("users_id_assign")
-        technician = fetch_user_name(client, technician_id, tech_cache)
-        metrics.setdefault(technician, {"total": 0, "resolved": 0, "resolution_hours": []})
-
-        metrics[technician]["total"] += 1
-
-        if ticket.get("status") in (5, 6):
-            metrics[technician]["resolved"] += 1
-            opened = parse_date(ticket.get("date"))
-            solved = parse_date(ticket.get("solvedate"))
-            if opened and solved:
-                delta = (solved - opened).total_seconds() / 3600
-                metrics[technician]["resolution_hours"].append(delta)
+def summarize_technicians(by_id: Dict[Any, Dict[str, Any]],
+                          technician_names: Dict[Optional[int], str]) -> List[Dict]:
+    """Resolve technician names and rank technicians by tickets resolved"""
+    # Several IDs can share a display name ("Unassigned", "User N"); merge them
+    metrics: Dict[str, Dict[str, Any]] = {}
+    for technician_id, data in by_id.items():
+        technician = technician_names[technician_id]
+        merged = metrics.get(technician)
+        if merged is None:
+            metrics[technician] = data
+        else:
+            merged["total"] += data["total"]
+            merged["resolved"] += data["resolved"]
+            merged["res_sum"] += data["res_sum"]
+            merged["res_n"] += data["res_n"]
 
     results = []
     for technician, data in metrics.items():
-        avg_resolution = (
-            round(sum(data["resolution_hours"]) / len(data["resolution_hours"]), 2)
-            if data["resolution_hours"]
-            else 0
-        )
+        avg_resolution = round(data["res_sum"] / data["res_n"], 2) if data["res_n"] else 0
         results.append({
             "technician": technician,
             "total": int(data["total"]),
@@ -280,14 +591,8 @@ def build_technician_metrics(tickets: List[Dict], client: GLPIClient) -> List[Di
     return sorted(results, key=lambda item: item["resolved"], reverse=True)
 
 
-def build_satisfaction_trends(tickets: List[Dict]) -> Dict[str, Any]:
+def summarize_satisfaction(ratings: Counter) -> Dict[str, Any]:
     """Analyze satisfaction ratings if available"""
-    ratings = []
-    for ticket in tickets:
-        rating = ticket.get("satisfaction")
-        if isinstance(rating, (int, float)) and rating > 0:
-            ratings.append(rating)
-
     if not ratings:
         return {
             "count": 0,
@@ -296,11 +601,12 @@ def build_satisfaction_trends(tickets: List[Dict]) -> Dict[str, Any]:
             "distribution": {}
         }
 
-    average = round(sum(ratings) / len(ratings), 2)
-    distribution = {str(score): ratings.count(score) for score in sorted(set(ratings))}
+    count = sum(ratings.values())
+    average = round(sum(score * hits for score, hits in ratings.items()) / count, 2)
+    distribution = {str(score): ratings[score] for score in sorted(ratings)}
 
     return {
-        "count": len(ratings),
+        "count": count,
         "average": average,
         "trend": "Positive" if average >= 4 else "Needs Attention",
         "distribution": distribution
@@ -310,65 +616,58 @@ def build_satisfaction_trends(tickets: List[Dict]) -> Dict[str, Any]:
 # REPORT GENERATION
 # ============================================================================
 
-def generate_html_report(
-    start: datetime,
-    end: datetime,
-    summary: Dict[str, Any],
-    sla: Dict[str, Any],
-    technicians: List[Dict],
-    satisfaction: Dict[str, Any],
-    output_path: Path
-) -> None:
-    """Generate HTML report for management"""
-
-    html = f"""
+# Page layout, parsed once at import and split around the technician rows so
+# the rows can be streamed to the file between the two halves. A
+# string.Template keeps the stylesheet free of brace escaping. Text from GLPI
+# is HTML-escaped before it is written.
+HTML_REPORT_HEAD = Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>Weekly Ticket Report</title>
     <style>
-        body {{ font-family: 'Segoe UI', Tahoma, sans-serif; background: #f5f7fb; margin: 0; padding: 0; }}
-        .container {{ max-width: 1100px; margin: 30px auto; background: white; padding: 30px; border-radius: 8px; }}
-        h1 {{ color: #1f3b6d; margin-bottom: 0; }}
-        h2 {{ color: #1f3b6d; margin-top: 30px; }}
-        .subtitle {{ color: #5b6b80; margin-top: 5px; }}
-        .summary-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-top: 20px; }}
-        .summary-card {{ background: #f0f4ff; padding: 15px; border-radius: 8px; }}
-        .summary-card h3 {{ margin: 0; font-size: 1rem; color: #2c3e50; }}
-        .summary-card p {{ margin: 5px 0 0; font-size: 1.6rem; font-weight: 700; color: #1f3b6d; }}
-        table {{ width: 100%; border-collapse: collapse; margin-top: 15px; }}
-        th, td {{ border-bottom: 1px solid #e0e6ed; text-align: left; padding: 10px; }}
-        th {{ background: #f8f9fb; }}
-        .badge {{ display: inline-block; padding: 4px 10px; border-radius: 12px; font-size: 0.85rem; }}
-        .badge-good {{ background: #e6f4ea; color: #1e7e34; }}
-        .badge-warn {{ background: #fff4e5; color: #ad5e00; }}
-        .badge-bad {{ background: #fdecea; color: #b02a37; }}
-        .note {{ margin-top: 25px; font-size: 0.9rem; color: #6c7a89; }}
+        body { font-family: 'Segoe UI', Tahoma, sans-serif; background: #f5f7fb; margin: 0; padding: 0; }
+        .container { max-width: 1100px; margin: 30px auto; background: white; padding: 30px; border-radius: 8px; }
+        h1 { color: #1f3b6d; margin-bottom: 0; }
+        h2 { color: #1f3b6d; margin-top: 30px; }
+        .subtitle { color: #5b6b80; margin-top: 5px; }
+        .summary-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-top: 20px; }
+        .summary-card { background: #f0f4ff; padding: 15px; border-radius: 8px; }
+        .summary-card h3 { margin: 0; font-size: 1rem; color: #2c3e50; }
+        .summary-card p { margin: 5px 0 0; font-size: 1.6rem; font-weight: 700; color: #1f3b6d; }
+        table { width: 100%; border-collapse: collapse; margin-top: 15px; }
+        th, td { border-bottom: 1px solid #e0e6ed; text-align: left; padding: 10px; }
+        th { background: #f8f9fb; }
+        .badge { display: inline-block; padding: 4px 10px; border-radius: 12px; font-size: 0.85rem; }
+        .badge-good { background: #e6f4ea; color: #1e7e34; }
+        .badge-warn { background: #fff4e5; color: #ad5e00; }
+        .badge-bad { background: #fdecea; color: #b02a37; }
+        .note { margin-top: 25px; font-size: 0.9rem; color: #6c7a89; }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>Weekly Ticket Operations Report</h1>
-        <div class="subtitle">Northwoods Health System | {start.strftime('%b %d, %Y')} – {end.strftime('%b %d, %Y')}</div>
+        <div class="subtitle">Northwoods Health System | $range_label</div>
 
         <h2>Executive Summary</h2>
         <div class="summary-grid">
             <div class="summary-card">
                 <h3>Tickets Opened</h3>
-                <p>{summary['opened']}</p>
+                <p>$opened</p>
             </div>
             <div class="summary-card">
                 <h3>Tickets Closed</h3>
-                <p>{summary['closed']}</p>
+                <p>$closed</p>
             </div>
             <div class="summary-card">
                 <h3>Pending</h3>
-                <p>{summary['pending']}</p>
+                <p>$pending</p>
             </div>
             <div class="summary-card">
                 <h3>SLA Compliance</h3>
-                <p>{sla['rate']}%</p>
+                <p>${sla_rate}%</p>
             </div>
         </div>
 
@@ -376,25 +675,27 @@ def generate_html_report(
         <table>
             <tr><th>Compliant</th><th>Non-Compliant</th><th>Unknown</th></tr>
             <tr>
-                <td>{sla['compliant']}</td>
-                <td>{sla['non_compliant']}</td>
-                <td>{sla['unknown']}</td>
+                <td>$compliant</td>
+                <td>$non_compliant</td>
+                <td>$unknown</td>
             </tr>
         </table>
 
         <h2>Technician Performance</h2>
         <table>
             <tr><th>Technician</th><th>Total Tickets</th><th>Resolved</th><th>Avg Resolution (hrs)</th></tr>
-            {''.join([f"<tr><td>{t['technician']}</td><td>{t['total']}</td><td>{t['resolved']}</td><td>{t['avg_resolution_hours']}</td></tr>" for t in technicians])}
+            """)
+
+HTML_REPORT_TAIL = Template("""
         </table>
 
         <h2>Client Satisfaction</h2>
         <table>
             <tr><th>Surveys Completed</th><th>Average Score (1-5)</th><th>Trend</th></tr>
             <tr>
-                <td>{satisfaction['count']}</td>
-                <td>{satisfaction['average']}</td>
-                <td>{satisfaction['trend']}</td>
+                <td>$survey_count</td>
+                <td>$survey_average</td>
+                <td>$survey_trend</td>
             </tr>
         </table>
 
@@ -405,16 +706,75 @@ def generate_html_report(
     </div>
 </body>
 </html>
-"""
-
-    output_path.write_text(html, encoding="utf-8")
+""")
 
 
-def write_csv_report(tickets: List[Dict], output_path: Path, client: GLPIClient) -> None:
+def generate_html_report(
+    range_label: str,
+    summary: Dict[str, Any],
+    sla: Dict[str, Any],
+    technicians: List[Dict],
+    satisfaction: Dict[str, Any],
+    output_path: Path
+) -> None:
+    """Generate HTML report for management (gzip-compressed if output_path ends in .gz)"""
+
+    technician_rows = (
+        f"<tr><td>{escape(str(t['technician']))}</td><td>{t['total']}</td>"
+        f"<td>{t['resolved']}</td><td>{t['avg_resolution_hours']}</td></tr>"
+        for t in technicians
+    )
+
+    if output_path.suffix == ".gz":
+        report_file = gzip.open(output_path, "wt", compresslevel=HTML_GZIP_LEVEL, encoding="utf-8")
+    else:
+        report_file = output_path.open("w", buffering=HTML_WRITE_BUFFER, encoding="utf-8")
+
+    with report_file as f:
+        f.write(HTML_REPORT_HEAD.substitute(
+            range_label=range_label,
+            opened=summary['opened'],
+            closed=summary['closed'],
+            pending=summary['pending'],
+            sla_rate=sla['rate'],
+            compliant=sla['compliant'],
+            non_compliant=sla['non_compliant'],
+            unknown=sla['unknown']
+        ))
+        f.writelines(technician_rows)
+        f.write(HTML_REPORT_TAIL.substitute(
+            survey_count=satisfaction['count'],
+            survey_average=satisfaction['average'],
+            survey_trend=escape(satisfaction['trend'])
+        ))
+
+
+def write_csv_report(columns: Dict[str, List], output_path: Path,
+                     technician_names: Dict[Optional[int], str]) -> None:
     """Export ticket data to CSV"""
-    tech_cache: Dict[int, str] = {}
+    # Name each distinct status code once; rows then need a single dict lookup
+    status_names = {
+        status: STATUS_NAMES[status] if type(status) is int and 0 < status < len(STATUS_NAMES) else "Unknown"
+        for status in set(columns["status"])
+    }
+    rows = (
+        (
+            ticket_id,
+            title,
+            status_names[status],
+            opened,
+            closed or solved,
+            technician_names[technician_id],
+            due
+        )
+        for ticket_id, title, status, opened, closed, solved, technician_id, due in zip(
+            columns["id"], columns["name"], columns["status"], columns["date"],
+            columns["closedate"], columns["solvedate"], columns["users_id_assign"],
+            columns["due_date"]
+        )
+    )
 
-    with output_path.open("w", newline="", encoding="utf-8") as csvfile:
+    with output_path.open("w", buffering=CSV_WRITE_BUFFER, newline="", encoding="utf-8") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow([
             "Ticket ID",
@@ -425,19 +785,7 @@ def write_csv_report(tickets: List[Dict], output_path: Path, client: GLPIClient)
             "Assigned Technician",
             "SLA Due Date"
         ])
-
-        for ticket in tickets:
-            status = STATUS_MAP.get(ticket.get("status"), "Unknown")
-            tech_name = fetch_user_name(client, ticket.get("users_id_assign"), tech_cache)
-            writer.writerow([
-                ticket.get("id"),
-                ticket.get("name"),
-                status,
-                ticket.get("date"),
-                ticket.get("closedate") or ticket.get("solvedate"),
-                tech_name,
-                ticket.get("due_date")
-            ])
+        writer.writerows(rows)
 
 # ============================================================================
 # MAIN
@@ -451,7 +799,7 @@ def load_config(path: Optional[str]) -> Dict[str, str]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    return json.loads(config_path.read_text(encoding="utf-8"))
+    return json_loads(config_path.read_bytes())
 
 
 def main() -> int:
@@ -463,6 +811,12 @@ def main() -> int:
     parser.add_argument("--start", help="Report start date (YYYY-MM-DD)")
     parser.add_argument("--end", help="Report end date (YYYY-MM-DD)")
     parser.add_argument("--output-dir", default=".", help="Directory to write reports")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help=f"Directory for cached technician names (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Look up every technician from GLPI without the on-disk cache")
+    parser.add_argument("--compress", action="store_true",
+                        help="Write the HTML report gzip-compressed (.html.gz)")
 
     args = parser.parse_args()
 
@@ -480,43 +834,88 @@ def main() -> int:
     start = datetime.strptime(args.start, "%Y-%m-%d") if args.start else end - timedelta(days=7)
 
     logger.info(f"Ticket Report Generator v{__version__}")
-    logger.info(f"Report range: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}")
+    # Format the report dates once; the log, file names and HTML reuse them
+    report_date = end.strftime('%Y-%m-%d')
+    range_label = f"{start.strftime('%b %d, %Y')} – {end.strftime('%b %d, %Y')}"
+
+    logger.info(f"Report range: {start.strftime('%Y-%m-%d')} to {report_date}")
 
     client = GLPIClient(url, username, password)
     if not client.init_session():
         return 1
 
+    # User IDs only mean something on one GLPI server, so each server/login
+    # pair gets its own cache file
+    cache_path = None
+    if not args.no_cache:
+        cache_key = hashlib.sha1(f"{client.username}@{client.base_url}".encode("utf-8")).hexdigest()
+        cache_path = Path(args.cache_dir).expanduser() / f"users-{cache_key}.json"
+    user_cache = UserCache(client, cache_path)
+
     try:
-        tickets = fetch_tickets(client)
-        logger.info(f"✓ Tickets retrieved: {len(tickets)}")
+        # One pass over the streamed pages: keep tickets created in range,
+        # count closed-in-range and pending
+        retrieved = 0
+        weekly_tickets = []
+        weekly_opened = []
+        closed = 0
+        pending = 0
+        for ticket in iter_tickets(client):
+            retrieved += 1
+            opened = parse_date(ticket.get("date"))
+            if is_within_range(opened, start, end):
+                weekly_tickets.append(ticket)
+                weekly_opened.append(opened)
+            if is_within_range(parse_date(ticket.get("closedate") or ticket.get("solvedate")), start, end):
+                closed += 1
+            if ticket.get("status") == 4:
+                pending += 1
 
-        # Filter tickets within range based on creation date
-        weekly_tickets = [
-            ticket for ticket in tickets
-            if is_within_range(parse_date(ticket.get("date")), start, end)
-        ]
+        logger.info(f"✓ Tickets retrieved: {retrieved}")
 
         summary = {
             "opened": len(weekly_tickets),
-            "closed": len([
-                t for t in tickets
-                if is_within_range(parse_date(t.get("closedate") or t.get("solvedate")), start, end)
-            ]),
-            "pending": len([t for t in tickets if t.get("status") == 4])
+            "closed": closed,
+            "pending": pending
         }
 
-        sla = calculate_sla_compliance(weekly_tickets, end)
-        technicians = build_technician_metrics(weekly_tickets, client)
-        satisfaction = build_satisfaction_trends(weekly_tickets)
-
-        output_dir = Path(args.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        html_path = output_dir / f"ticket-report-{end.strftime('%Y-%m-%d')}.html"
-        csv_path = output_dir / f"ticket-report-{end.strftime('%Y-%m-%d')}.csv"
-
-        generate_html_report(start, end, summary, sla, technicians, satisfaction, html_path)
-        write_csv_report(weekly_tickets, csv_path, client)
+        weekly_columns = tickets_to_columns(weekly_tickets, weekly_opened)
+
+        with user_cache:
+            # One bulk User fetch beats a User/{id} GET per unknown or stale technician
+            technician_ids = {user_id for user_id in weekly_columns["users_id_assign"] if user_id}
+            missing_ids = user_cache.missing(technician_ids)
+            if missing_ids:
+                names, complete = prefetch_users(client)
+                # IDs absent from a complete user list are not GLPI users; cache
+                # their fallback name so later runs don't look them up again.
+                # With pages missing they may be real users, so they are left
+                # to the per-user lookup instead
+                if names and complete:
+                    names.update({user_id: f"User {user_id}" for user_id in missing_ids - names.keys()})
+                user_cache.store_many(names)
+
+            # Resolve every technician once, concurrently, before any analysis or
+            # rendering; both passes below then only do dict lookups
+            technician_names = resolve_user_names(client, weekly_columns["users_id_assign"], user_cache)
+
+            sla, technicians, satisfaction = analyze_tickets(weekly_columns, end, technician_names)
+
+            output_dir = Path(args.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            html_path = output_dir / f"ticket-report-{report_date}.html{'.gz' if args.compress else ''}"
+            csv_path = output_dir / f"ticket-report-{report_date}.csv"
+
+            # The two outputs are independent; write them side by side and let
+            # result() re-raise any failure before the session is closed
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                html_future = executor.submit(
+                    generate_html_report, range_label, summary, sla, technicians, satisfaction, html_path
+                )
+                csv_future = executor.submit(write_csv_report, weekly_columns, csv_path, technician_names)
+                html_future.result()
+                csv_future.result()
 
         logger.info(f"✓ Report generated: {html_path}")
         logger.info(f"✓ CSV export saved: {csv_path}")